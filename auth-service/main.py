@@ -10,6 +10,7 @@ import concurrent.futures as futures
 
 import grpc
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
@@ -34,10 +35,22 @@ JWT_ALG = os.getenv("JWT_ALG", "HS256")
 JWT_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", "60"))
 GRPC_PORT = int(os.getenv("AUTH_GRPC_PORT", "50051"))
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# This service's share of the shared Postgres connection budget (see infra/docker-compose.yml). No overflow:
+# gRPC/REST threads beyond the pool wait for a connection instead of pushing past max_connections.
+# LIFO keeps checkouts on the warm connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "0"))
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-app = FastAPI(title="Auth Service", version="0.1.0")
+app = FastAPI(title="Auth Service", version="0.1.0", default_response_class=ORJSONResponse)
 
 SERVICE_NAME = "auth-service"
 logging.basicConfig(
@@ -73,8 +86,10 @@ async def log_requests(request: Request, call_next):
         duration_ms = (time.perf_counter() - start) * 1000
         logger.exception("%s %s -> unhandled error (%.2f ms)", request.method, request.url.path, duration_ms)
         raise
-    duration_ms = (time.perf_counter() - start) * 1000
-    logger.info("%s %s -> %s (%.2f ms)", request.method, request.url.path, response.status_code, duration_ms)
+    # Success lines are INFO; skip the timing math and URL build entirely when that level is off.
+    if logger.isEnabledFor(logging.INFO):
+        duration_ms = (time.perf_counter() - start) * 1000
+        logger.info("%s %s -> %s (%.2f ms)", request.method, request.url.path, response.status_code, duration_ms)
     return response
 
 
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0c\x63ourse.proto\x12\x06\x63ourse\"\xab\x01\n\x06\x43ourse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x05 \x01(\x05\x12\x0c\n\x04term\x18\x06 \x01(\t\x12\x15\n\racademic_year\x18\x07 \x01(\t\x12\x0f\n\x07section\x18\x08 \x01(\t\x12\x1b\n\x13\x61ssigned_faculty_id\x18\t \x01(\t\"\x14\n\x12ListCoursesRequest\"6\n\x13ListCoursesResponse\x12\x1f\n\x07\x63ourses\x18\x01 \x03(\x0b\x32\x0e.course.Course\"/\n\x19ListFacultyCoursesRequest\x12\x12\n\nfaculty_id\x18\x01 \x01(\t\":\n\x10GetCourseRequest\x12\x0c\n\x02id\x18\x01 \x01(\tH\x00\x12\x0e\n\x04\x63ode\x18\x02 \x01(\tH\x00\x42\x08\n\x06lookup\"3\n\x11GetCourseResponse\x12\x1e\n\x06\x63ourse\x18\x01 \x01(\x0b\x32\x0e.course.Course2\xef\x01\n\rCourseService\x12\x46\n\x0bListCourses\x12\x1a.course.ListCoursesRequest\x1a\x1b.course.ListCoursesResponse\x12T\n\x12ListFacultyCourses\x12!.course.ListFacultyCoursesRequest\x1a\x1b.course.ListCoursesResponse\x12@\n\tGetCourse\x12\x18.course.GetCourseRequest\x1a\x19.course.GetCourseResponseB\x16\n\x12\x63om.stdiscm.courseP\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0c\x63ourse.proto\x12\x06\x63ourse\"\xab\x01\n\x06\x43ourse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x05 \x01(\x05\x12\x0c\n\x04term\x18\x06 \x01(\t\x12\x15\n\racademic_year\x18\x07 \x01(\t\x12\x0f\n\x07section\x18\x08 \x01(\t\x12\x1b\n\x13\x61ssigned_faculty_id\x18\t \x01(\t\"9\n\x12ListCoursesRequest\x12\x0c\n\x04term\x18\x01 \x01(\t\x12\x15\n\racademic_year\x18\x02 \x01(\t\"6\n\x13ListCoursesResponse\x12\x1f\n\x07\x63ourses\x18\x01 \x03(\x0b\x32\x0e.course.Course\"/\n\x19ListFacultyCoursesRequest\x12\x12\n\nfaculty_id\x18\x01 \x01(\t\":\n\x10GetCourseRequest\x12\x0c\n\x02id\x18\x01 \x01(\tH\x00\x12\x0e\n\x04\x63ode\x18\x02 \x01(\tH\x00\x42\x08\n\x06lookup\"3\n\x11GetCourseResponse\x12\x1e\n\x06\x63ourse\x18\x01 \x01(\x0b\x32\x0e.course.Course\"%\n\x16\x42\x61tchGetCoursesRequest\x12\x0b\n\x03ids\x18\x01 \x03(\t\":\n\x17\x42\x61tchGetCoursesResponse\x12\x1f\n\x07\x63ourses\x18\x01 \x03(\x0b\x32\x0e.course.Course2\xb8\x02\n\rCourseService\x12;\n\x0bListCourses\x12\x1a.course.ListCoursesRequest\x1a\x0e.course.Course0\x01\x12T\n\x12ListFacultyCourses\x12!.course.ListFacultyCoursesRequest\x1a\x1b.course.ListCoursesResponse\x12@\n\tGetCourse\x12\x18.course.GetCourseRequest\x1a\x19.course.GetCourseResponse\x12R\n\x0f\x42\x61tchGetCourses\x12\x1e.course.BatchGetCoursesRequest\x1a\x1f.course.BatchGetCoursesResponseB\x16\n\x12\x63om.stdiscm.courseP\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,15 +35,19 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_COURSE']._serialized_start=25
   _globals['_COURSE']._serialized_end=196
   _globals['_LISTCOURSESREQUEST']._serialized_start=198
-  _globals['_LISTCOURSESREQUEST']._serialized_end=218
-  _globals['_LISTCOURSESRESPONSE']._serialized_start=220
-  _globals['_LISTCOURSESRESPONSE']._serialized_end=274
-  _globals['_LISTFACULTYCOURSESREQUEST']._serialized_start=276
-  _globals['_LISTFACULTYCOURSESREQUEST']._serialized_end=323
-  _globals['_GETCOURSEREQUEST']._serialized_start=325
-  _globals['_GETCOURSEREQUEST']._serialized_end=383
-  _globals['_GETCOURSERESPONSE']._serialized_start=385
-  _globals['_GETCOURSERESPONSE']._serialized_end=436
-  _globals['_COURSESERVICE']._serialized_start=439
-  _globals['_COURSESERVICE']._serialized_end=678
+  _globals['_LISTCOURSESREQUEST']._serialized_end=255
+  _globals['_LISTCOURSESRESPONSE']._serialized_start=257
+  _globals['_LISTCOURSESRESPONSE']._serialized_end=311
+  _globals['_LISTFACULTYCOURSESREQUEST']._serialized_start=313
+  _globals['_LISTFACULTYCOURSESREQUEST']._serialized_end=360
+  _globals['_GETCOURSEREQUEST']._serialized_start=362
+  _globals['_GETCOURSEREQUEST']._serialized_end=420
+  _globals['_GETCOURSERESPONSE']._serialized_start=422
+  _globals['_GETCOURSERESPONSE']._serialized_end=473
+  _globals['_BATCHGETCOURSESREQUEST']._serialized_start=475
+  _globals['_BATCHGETCOURSESREQUEST']._serialized_end=512
+  _globals['_BATCHGETCOURSESRESPONSE']._serialized_start=514
+  _globals['_BATCHGETCOURSESRESPONSE']._serialized_end=572
+  _globals['_COURSESERVICE']._serialized_start=575
+  _globals['_COURSESERVICE']._serialized_end=887
 # @@protoc_insertion_point(module_scope)
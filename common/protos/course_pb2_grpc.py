@@ -34,10 +34,10 @@ class CourseServiceStub(object):
         Args:
             channel: A grpc.Channel.
         """
-        self.ListCourses = channel.unary_unary(
+        self.ListCourses = channel.unary_stream(
                 '/course.CourseService/ListCourses',
                 request_serializer=course__pb2.ListCoursesRequest.SerializeToString,
-                response_deserializer=course__pb2.ListCoursesResponse.FromString,
+                response_deserializer=course__pb2.Course.FromString,
                 _registered_method=True)
         self.ListFacultyCourses = channel.unary_unary(
                 '/course.CourseService/ListFacultyCourses',
@@ -49,6 +49,11 @@ class CourseServiceStub(object):
                 request_serializer=course__pb2.GetCourseRequest.SerializeToString,
                 response_deserializer=course__pb2.GetCourseResponse.FromString,
                 _registered_method=True)
+        self.BatchGetCourses = channel.unary_unary(
+                '/course.CourseService/BatchGetCourses',
+                request_serializer=course__pb2.BatchGetCoursesRequest.SerializeToString,
+                response_deserializer=course__pb2.BatchGetCoursesResponse.FromString,
+                _registered_method=True)
 
 
 class CourseServiceServicer(object):
@@ -72,13 +77,19 @@ class CourseServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchGetCourses(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_CourseServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
-            'ListCourses': grpc.unary_unary_rpc_method_handler(
+            'ListCourses': grpc.unary_stream_rpc_method_handler(
                     servicer.ListCourses,
                     request_deserializer=course__pb2.ListCoursesRequest.FromString,
-                    response_serializer=course__pb2.ListCoursesResponse.SerializeToString,
+                    response_serializer=course__pb2.Course.SerializeToString,
             ),
             'ListFacultyCourses': grpc.unary_unary_rpc_method_handler(
                     servicer.ListFacultyCourses,
@@ -90,6 +101,11 @@ def add_CourseServiceServicer_to_server(servicer, server):
                     request_deserializer=course__pb2.GetCourseRequest.FromString,
                     response_serializer=course__pb2.GetCourseResponse.SerializeToString,
             ),
+            'BatchGetCourses': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetCourses,
+                    request_deserializer=course__pb2.BatchGetCoursesRequest.FromString,
+                    response_serializer=course__pb2.BatchGetCoursesResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'course.CourseService', rpc_method_handlers)
@@ -112,12 +128,12 @@ class CourseService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(
+        return grpc.experimental.unary_stream(
             request,
             target,
             '/course.CourseService/ListCourses',
             course__pb2.ListCoursesRequest.SerializeToString,
-            course__pb2.ListCoursesResponse.FromString,
+            course__pb2.Course.FromString,
             options,
             channel_credentials,
             insecure,
@@ -181,3 +197,30 @@ class CourseService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def BatchGetCourses(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/course.CourseService/BatchGetCourses',
+            course__pb2.BatchGetCoursesRequest.SerializeToString,
+            course__pb2.BatchGetCoursesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bgrade.proto\x12\x05grade\"\x9e\x01\n\x0bGradeRecord\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nstudent_id\x18\x02 \x01(\t\x12\x11\n\tcourse_id\x18\x03 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x04 \x01(\t\x12\x13\n\x0b\x63ourse_name\x18\x05 \x01(\t\x12\x0c\n\x04term\x18\x06 \x01(\t\x12\x15\n\racademic_year\x18\x07 \x01(\t\x12\r\n\x05grade\x18\x08 \x01(\t\"\x99\x01\n\x12SubmitGradeRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\x12\x11\n\tcourse_id\x18\x02 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x03 \x01(\t\x12\x13\n\x0b\x63ourse_name\x18\x04 \x01(\t\x12\x0c\n\x04term\x18\x05 \x01(\t\x12\x15\n\racademic_year\x18\x06 \x01(\t\x12\r\n\x05grade\x18\x07 \x01(\t\"9\n\x13SubmitGradeResponse\x12\"\n\x06record\x18\x01 \x01(\x0b\x32\x12.grade.GradeRecord\"6\n\x11StudentGradeInput\x12\x12\n\nstudent_id\x18\x01 \x01(\t\x12\r\n\x05grade\x18\x02 \x01(\t\"\xa2\x01\n\x13SubmitGradesRequest\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x02 \x01(\t\x12\x13\n\x0b\x63ourse_name\x18\x03 \x01(\t\x12\x0c\n\x04term\x18\x04 \x01(\t\x12\x15\n\racademic_year\x18\x05 \x01(\t\x12)\n\x07records\x18\x06 \x03(\x0b\x32\x18.grade.StudentGradeInput\";\n\x14SubmitGradesResponse\x12#\n\x07records\x18\x01 \x03(\x0b\x32\x12.grade.GradeRecord\"\'\n\x11ListGradesRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\"8\n\x12ListGradesResponse\x12\"\n\x06grades\x18\x01 \x03(\x0b\x32\x12.grade.GradeRecord\"&\n\x10GetGradesRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\"4\n\x0eGradesResponse\x12\"\n\x06grades\x18\x01 \x03(\x0b\x32\x12.grade.GradeRecord\"f\n\x17ListCourseGradesRequest\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x02 \x01(\t\x12\x0c\n\x04term\x18\x03 \x01(\t\x12\x15\n\racademic_year\x18\x04 \x01(\t\">\n\x18ListCourseGradesResponse\x12\"\n\x06grades\x18\x01 \x03(\x0b\x32\x12.grade.GradeRecord\"]\n\x0fTermCourseGrade\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x02 \x01(\t\x12\x13\n\x0b\x63ourse_name\x18\x03 \x01(\t\x12\r\n\x05grade\x18\x04 \x01(\t\"_\n\x0fTermGradesGroup\x12\x15\n\racademic_year\x18\x01 \x01(\t\x12\x0c\n\x04term\x18\x02 \x01(\t\x12\'\n\x07\x63ourses\x18\x03 \x03(\x0b\x32\x16.grade.TermCourseGrade\"2\n\x1cListStudentTermGradesRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\"G\n\x1dListStudentTermGradesResponse\x12&\n\x06groups\x18\x01 \x03(\x0b\x32\x16.grade.TermGradesGroup2\xdf\x03\n\x0cGradeService\x12\x44\n\x0bSubmitGrade\x12\x19.grade.SubmitGradeRequest\x1a\x1a.grade.SubmitGradeResponse\x12G\n\x0cSubmitGrades\x12\x1a.grade.SubmitGradesRequest\x1a\x1b.grade.SubmitGradesResponse\x12\x44\n\x12GetGradesByStudent\x12\x17.grade.GetGradesRequest\x1a\x15.grade.GradesResponse\x12\x41\n\nListGrades\x12\x18.grade.ListGradesRequest\x1a\x19.grade.ListGradesResponse\x12S\n\x10ListCourseGrades\x12\x1e.grade.ListCourseGradesRequest\x1a\x1f.grade.ListCourseGradesResponse\x12\x62\n\x15ListStudentTermGrades\x12#.grade.ListStudentTermGradesRequest\x1a$.grade.ListStudentTermGradesResponseB\x15\n\x11\x63om.stdiscm.gradeP\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bgrade.proto\x12\x05grade\"\x9e\x01\n\x0bGradeRecord\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nstudent_id\x18\x02 \x01(\t\x12\x11\n\tcourse_id\x18\x03 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x04 \x01(\t\x12\x13\n\x0b\x63ourse_name\x18\x05 \x01(\t\x12\x0c\n\x04term\x18\x06 \x01(\t\x12\x15\n\racademic_year\x18\x07 \x01(\t\x12\r\n\x05grade\x18\x08 \x01(\t\"\x99\x01\n\x12SubmitGradeRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\x12\x11\n\tcourse_id\x18\x02 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x03 \x01(\t\x12\x13\n\x0b\x63ourse_name\x18\x04 \x01(\t\x12\x0c\n\x04term\x18\x05 \x01(\t\x12\x15\n\racademic_year\x18\x06 \x01(\t\x12\r\n\x05grade\x18\x07 \x01(\t\"9\n\x13SubmitGradeResponse\x12\"\n\x06record\x18\x01 \x01(\x0b\x32\x12.grade.GradeRecord\"6\n\x11StudentGradeInput\x12\x12\n\nstudent_id\x18\x01 \x01(\t\x12\r\n\x05grade\x18\x02 \x01(\t\"\xa2\x01\n\x13SubmitGradesRequest\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x02 \x01(\t\x12\x13\n\x0b\x63ourse_name\x18\x03 \x01(\t\x12\x0c\n\x04term\x18\x04 \x01(\t\x12\x15\n\racademic_year\x18\x05 \x01(\t\x12)\n\x07records\x18\x06 \x03(\x0b\x32\x18.grade.StudentGradeInput\";\n\x14SubmitGradesResponse\x12#\n\x07records\x18\x01 \x03(\x0b\x32\x12.grade.GradeRecord\"J\n\x11ListGradesRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\"&\n\x10GetGradesRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\"4\n\x0eGradesResponse\x12\"\n\x06grades\x18\x01 \x03(\x0b\x32\x12.grade.GradeRecord\"\x89\x01\n\x17ListCourseGradesRequest\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x02 \x01(\t\x12\x0c\n\x04term\x18\x03 \x01(\t\x12\x15\n\racademic_year\x18\x04 \x01(\t\x12\r\n\x05limit\x18\x05 \x01(\x05\x12\x12\n\npage_token\x18\x06 \x01(\t\"]\n\x0fTermCourseGrade\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x02 \x01(\t\x12\x13\n\x0b\x63ourse_name\x18\x03 \x01(\t\x12\r\n\x05grade\x18\x04 \x01(\t\"_\n\x0fTermGradesGroup\x12\x15\n\racademic_year\x18\x01 \x01(\t\x12\x0c\n\x04term\x18\x02 \x01(\t\x12\'\n\x07\x63ourses\x18\x03 \x03(\x0b\x32\x16.grade.TermCourseGrade\"2\n\x1cListStudentTermGradesRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\"G\n\x1dListStudentTermGradesResponse\x12&\n\x06groups\x18\x01 \x03(\x0b\x32\x16.grade.TermGradesGroup2\xcf\x03\n\x0cGradeService\x12\x44\n\x0bSubmitGrade\x12\x19.grade.SubmitGradeRequest\x1a\x1a.grade.SubmitGradeResponse\x12G\n\x0cSubmitGrades\x12\x1a.grade.SubmitGradesRequest\x1a\x1b.grade.SubmitGradesResponse\x12\x44\n\x12GetGradesByStudent\x12\x17.grade.GetGradesRequest\x1a\x15.grade.GradesResponse\x12<\n\nListGrades\x12\x18.grade.ListGradesRequest\x1a\x12.grade.GradeRecord0\x01\x12H\n\x10ListCourseGrades\x12\x1e.grade.ListCourseGradesRequest\x1a\x12.grade.GradeRecord0\x01\x12\x62\n\x15ListStudentTermGrades\x12#.grade.ListStudentTermGradesRequest\x1a$.grade.ListStudentTermGradesResponseB\x15\n\x11\x63om.stdiscm.gradeP\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -45,25 +45,21 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_SUBMITGRADESRESPONSE']._serialized_start=619
   _globals['_SUBMITGRADESRESPONSE']._serialized_end=678
   _globals['_LISTGRADESREQUEST']._serialized_start=680
-  _globals['_LISTGRADESREQUEST']._serialized_end=719
-  _globals['_LISTGRADESRESPONSE']._serialized_start=721
-  _globals['_LISTGRADESRESPONSE']._serialized_end=777
-  _globals['_GETGRADESREQUEST']._serialized_start=779
-  _globals['_GETGRADESREQUEST']._serialized_end=817
-  _globals['_GRADESRESPONSE']._serialized_start=819
-  _globals['_GRADESRESPONSE']._serialized_end=871
-  _globals['_LISTCOURSEGRADESREQUEST']._serialized_start=873
-  _globals['_LISTCOURSEGRADESREQUEST']._serialized_end=975
-  _globals['_LISTCOURSEGRADESRESPONSE']._serialized_start=977
-  _globals['_LISTCOURSEGRADESRESPONSE']._serialized_end=1039
-  _globals['_TERMCOURSEGRADE']._serialized_start=1041
-  _globals['_TERMCOURSEGRADE']._serialized_end=1134
-  _globals['_TERMGRADESGROUP']._serialized_start=1136
-  _globals['_TERMGRADESGROUP']._serialized_end=1231
-  _globals['_LISTSTUDENTTERMGRADESREQUEST']._serialized_start=1233
-  _globals['_LISTSTUDENTTERMGRADESREQUEST']._serialized_end=1283
-  _globals['_LISTSTUDENTTERMGRADESRESPONSE']._serialized_start=1285
-  _globals['_LISTSTUDENTTERMGRADESRESPONSE']._serialized_end=1356
-  _globals['_GRADESERVICE']._serialized_start=1359
-  _globals['_GRADESERVICE']._serialized_end=1838
+  _globals['_LISTGRADESREQUEST']._serialized_end=754
+  _globals['_GETGRADESREQUEST']._serialized_start=756
+  _globals['_GETGRADESREQUEST']._serialized_end=794
+  _globals['_GRADESRESPONSE']._serialized_start=796
+  _globals['_GRADESRESPONSE']._serialized_end=848
+  _globals['_LISTCOURSEGRADESREQUEST']._serialized_start=851
+  _globals['_LISTCOURSEGRADESREQUEST']._serialized_end=988
+  _globals['_TERMCOURSEGRADE']._serialized_start=990
+  _globals['_TERMCOURSEGRADE']._serialized_end=1083
+  _globals['_TERMGRADESGROUP']._serialized_start=1085
+  _globals['_TERMGRADESGROUP']._serialized_end=1180
+  _globals['_LISTSTUDENTTERMGRADESREQUEST']._serialized_start=1182
+  _globals['_LISTSTUDENTTERMGRADESREQUEST']._serialized_end=1232
+  _globals['_LISTSTUDENTTERMGRADESRESPONSE']._serialized_start=1234
+  _globals['_LISTSTUDENTTERMGRADESRESPONSE']._serialized_end=1305
+  _globals['_GRADESERVICE']._serialized_start=1308
+  _globals['_GRADESERVICE']._serialized_end=1771
 # @@protoc_insertion_point(module_scope)
@@ -49,15 +49,15 @@ class GradeServiceStub(object):
                 request_serializer=grade__pb2.GetGradesRequest.SerializeToString,
                 response_deserializer=grade__pb2.GradesResponse.FromString,
                 _registered_method=True)
-        self.ListGrades = channel.unary_unary(
+        self.ListGrades = channel.unary_stream(
                 '/grade.GradeService/ListGrades',
                 request_serializer=grade__pb2.ListGradesRequest.SerializeToString,
-                response_deserializer=grade__pb2.ListGradesResponse.FromString,
+                response_deserializer=grade__pb2.GradeRecord.FromString,
                 _registered_method=True)
-        self.ListCourseGrades = channel.unary_unary(
+        self.ListCourseGrades = channel.unary_stream(
                 '/grade.GradeService/ListCourseGrades',
                 request_serializer=grade__pb2.ListCourseGradesRequest.SerializeToString,
-                response_deserializer=grade__pb2.ListCourseGradesResponse.FromString,
+                response_deserializer=grade__pb2.GradeRecord.FromString,
                 _registered_method=True)
         self.ListStudentTermGrades = channel.unary_unary(
                 '/grade.GradeService/ListStudentTermGrades',
@@ -123,15 +123,15 @@ def add_GradeServiceServicer_to_server(servicer, server):
                     request_deserializer=grade__pb2.GetGradesRequest.FromString,
                     response_serializer=grade__pb2.GradesResponse.SerializeToString,
             ),
-            'ListGrades': grpc.unary_unary_rpc_method_handler(
+            'ListGrades': grpc.unary_stream_rpc_method_handler(
                     servicer.ListGrades,
                     request_deserializer=grade__pb2.ListGradesRequest.FromString,
-                    response_serializer=grade__pb2.ListGradesResponse.SerializeToString,
+                    response_serializer=grade__pb2.GradeRecord.SerializeToString,
             ),
-            'ListCourseGrades': grpc.unary_unary_rpc_method_handler(
+            'ListCourseGrades': grpc.unary_stream_rpc_method_handler(
                     servicer.ListCourseGrades,
                     request_deserializer=grade__pb2.ListCourseGradesRequest.FromString,
-                    response_serializer=grade__pb2.ListCourseGradesResponse.SerializeToString,
+                    response_serializer=grade__pb2.GradeRecord.SerializeToString,
             ),
             'ListStudentTermGrades': grpc.unary_unary_rpc_method_handler(
                     servicer.ListStudentTermGrades,
@@ -241,12 +241,12 @@ class GradeService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(
+        return grpc.experimental.unary_stream(
             request,
             target,
             '/grade.GradeService/ListGrades',
             grade__pb2.ListGradesRequest.SerializeToString,
-            grade__pb2.ListGradesResponse.FromString,
+            grade__pb2.GradeRecord.FromString,
             options,
             channel_credentials,
             insecure,
@@ -268,12 +268,12 @@ class GradeService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(
+        return grpc.experimental.unary_stream(
             request,
             target,
             '/grade.GradeService/ListCourseGrades',
             grade__pb2.ListCourseGradesRequest.SerializeToString,
-            grade__pb2.ListCourseGradesResponse.FromString,
+            grade__pb2.GradeRecord.FromString,
             options,
             channel_credentials,
             insecure,
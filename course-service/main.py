@@ -6,10 +6,11 @@ import threading
 import time
 from pathlib import Path
 from typing import List, Optional
-from uuid import uuid4
+from uuid import UUID as PyUUID, uuid4
 
 import grpc
 from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy import Column, Integer, String, Text, create_engine, text
 from sqlalchemy.dialects.postgresql import UUID
@@ -31,9 +32,23 @@ except ImportError as exc:  # pragma: no cover
 
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://postgres:postgres@db:5432/enrollment")
 GRPC_PORT = int(os.getenv("COURSE_GRPC_PORT", "50052"))
+# Let idle gateway channels keep their 30s keepalive pings without tripping GOAWAY "too_many_pings".
+GRPC_SERVER_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_ping_interval_without_data_ms", 10000),
+]
+# This service's share of the shared Postgres connection budget (see infra/docker-compose.yml). No overflow:
+# gRPC/REST threads beyond the pool wait for a connection instead of pushing past max_connections.
+# LIFO keeps checkouts on the warm connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "0"))
 engine = create_engine(
     DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=1800,
     pool_pre_ping=True,
+    pool_use_lifo=True,
     connect_args={"options": "-c search_path=course_catalog,public"},
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -55,7 +70,7 @@ class Course(Base):
     assigned_faculty_id = Column(UUID(as_uuid=True), nullable=True)
 
 
-app = FastAPI(title="Course Service", version="0.1.0")
+app = FastAPI(title="Course Service", version="0.1.0", default_response_class=ORJSONResponse)
 SERVICE_NAME = "course-service"
 logging.basicConfig(
     level=logging.INFO,
@@ -97,8 +112,10 @@ async def log_requests(request: Request, call_next):
         duration_ms = (time.perf_counter() - start) * 1000
         logger.exception("%s %s -> unhandled error (%.2f ms)", request.method, request.url.path, duration_ms)
         raise
-    duration_ms = (time.perf_counter() - start) * 1000
-    logger.info("%s %s -> %s (%.2f ms)", request.method, request.url.path, response.status_code, duration_ms)
+    # Success lines are INFO; skip the timing math and URL build entirely when that level is off.
+    if logger.isEnabledFor(logging.INFO):
+        duration_ms = (time.perf_counter() - start) * 1000
+        logger.info("%s %s -> %s (%.2f ms)", request.method, request.url.path, response.status_code, duration_ms)
     return response
 
 
@@ -169,11 +186,16 @@ def get_course(course_id: str, db: Session = Depends(get_db)):
 # ---------- gRPC service ----------
 class CourseService(course_pb2_grpc.CourseServiceServicer):
     def ListCourses(self, request, context):
+        """Stream the catalog one course at a time so callers never buffer it whole."""
         db = SessionLocal()
         try:
-            rows = db.query(Course).all()
-            courses = [
-                course_pb2.Course(
+            query = db.query(Course)
+            if request.term:
+                query = query.filter(Course.term == request.term)
+            if request.academic_year:
+                query = query.filter(Course.academic_year == request.academic_year)
+            for r in query.yield_per(500):
+                yield course_pb2.Course(
                     id=str(r.id),
                     code=r.code,
                     title=r.title,
@@ -184,9 +206,6 @@ class CourseService(course_pb2_grpc.CourseServiceServicer):
                     section=r.section or "",
                     assigned_faculty_id=str(r.assigned_faculty_id) if r.assigned_faculty_id else "",
                 )
-                for r in rows
-            ]
-            return course_pb2.ListCoursesResponse(courses=courses)
         finally:
             db.close()
 
@@ -217,6 +236,37 @@ class CourseService(course_pb2_grpc.CourseServiceServicer):
         finally:
             db.close()
 
+    def BatchGetCourses(self, request, context):
+        """Return every known course among `ids`; unknown or malformed ids are simply omitted."""
+        ids = []
+        for raw in set(request.ids):
+            try:
+                ids.append(PyUUID(raw))
+            except ValueError:
+                continue
+        if not ids:
+            return course_pb2.BatchGetCoursesResponse()
+        db = SessionLocal()
+        try:
+            rows = db.query(Course).filter(Course.id.in_(ids)).all()
+            courses = [
+                course_pb2.Course(
+                    id=str(r.id),
+                    code=r.code,
+                    title=r.title,
+                    description=r.description or "",
+                    capacity=r.capacity or 0,
+                    term=r.term or "",
+                    academic_year=r.academic_year or "",
+                    section=r.section or "",
+                    assigned_faculty_id=str(r.assigned_faculty_id) if r.assigned_faculty_id else "",
+                )
+                for r in rows
+            ]
+            return course_pb2.BatchGetCoursesResponse(courses=courses)
+        finally:
+            db.close()
+
     def ListFacultyCourses(self, request, context):
         """Return courses assigned to the given faculty UUID."""
         db = SessionLocal()
@@ -242,7 +292,7 @@ class CourseService(course_pb2_grpc.CourseServiceServicer):
 
 
 def serve_grpc():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=GRPC_SERVER_OPTIONS)
     course_pb2_grpc.add_CourseServiceServicer_to_server(CourseService(), server)
     server.add_insecure_port(f"[::]:{GRPC_PORT}")
     server.start()
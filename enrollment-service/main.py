@@ -11,6 +11,7 @@ from uuid import uuid4
 
 import grpc
 from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy import Column, Integer, String, create_engine, func, text
 from sqlalchemy.dialects.postgresql import UUID
@@ -32,9 +33,23 @@ except ImportError as exc:  # pragma: no cover
 
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://postgres:postgres@db:5432/enrollment")
 GRPC_PORT = int(os.getenv("ENROLLMENT_GRPC_PORT", "50053"))
+# Let idle gateway channels keep their 30s keepalive pings without tripping GOAWAY "too_many_pings".
+GRPC_SERVER_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_ping_interval_without_data_ms", 10000),
+]
+# This service's share of the shared Postgres connection budget (see infra/docker-compose.yml). No overflow:
+# gRPC/REST threads beyond the pool wait for a connection instead of pushing past max_connections.
+# LIFO keeps checkouts on the warm connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "0"))
 engine = create_engine(
     DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=1800,
     pool_pre_ping=True,
+    pool_use_lifo=True,
     connect_args={"options": "-c search_path=enrollment,public"},
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -80,7 +95,7 @@ class Student(Base):
     user_number = Column(String(32))
 
 
-app = FastAPI(title="Enrollment Service", version="0.1.0")
+app = FastAPI(title="Enrollment Service", version="0.1.0", default_response_class=ORJSONResponse)
 SERVICE_NAME = "enrollment-service"
 logging.basicConfig(
     level=logging.INFO,
@@ -115,8 +130,10 @@ async def log_requests(request: Request, call_next):
         duration_ms = (time.perf_counter() - start) * 1000
         logger.exception("%s %s -> unhandled error (%.2f ms)", request.method, request.url.path, duration_ms)
         raise
-    duration_ms = (time.perf_counter() - start) * 1000
-    logger.info("%s %s -> %s (%.2f ms)", request.method, request.url.path, response.status_code, duration_ms)
+    # Success lines are INFO; skip the timing math and URL build entirely when that level is off.
+    if logger.isEnabledFor(logging.INFO):
+        duration_ms = (time.perf_counter() - start) * 1000
+        logger.info("%s %s -> %s (%.2f ms)", request.method, request.url.path, response.status_code, duration_ms)
     return response
 
 
@@ -329,9 +346,9 @@ def enroll(body: EnrollRequestBody, db: Session = Depends(get_db)):
         db.commit()
         db.refresh(existing_same_section)
         return {
-            "id": str(existing_same_section.id),
-            "student_id": str(existing_same_section.student_id),
-            "course_id": str(existing_same_section.course_id),
+            "id": existing_same_section.id,
+            "student_id": existing_same_section.student_id,
+            "course_id": existing_same_section.course_id,
             "status": existing_same_section.status,
         }
 
@@ -352,9 +369,9 @@ def enroll(body: EnrollRequestBody, db: Session = Depends(get_db)):
         raise HTTPException(status_code=409, detail="Already enrolled")
     db.refresh(enr)
     return {
-        "id": str(enr.id),
-        "student_id": str(enr.student_id),
-        "course_id": str(enr.course_id),
+        "id": enr.id,
+        "student_id": enr.student_id,
+        "course_id": enr.course_id,
         "status": enr.status,
     }
 
@@ -369,9 +386,9 @@ def list_enrollments(student_id: str, db: Session = Depends(get_db)):
     )
     return [
         {
-            "id": str(enr.id),
-            "student_id": str(enr.student_id),
-            "course_id": str(enr.course_id),
+            "id": enr.id,
+            "student_id": enr.student_id,
+            "course_id": enr.course_id,
             "status": enr.status,
             "term": course.term,
             "academic_year": course.academic_year,
@@ -391,7 +408,7 @@ def course_roster(course_id: str, db: Session = Depends(get_db)):
     )
     return [
         {
-            "student_id": str(enr.student_id),
+            "student_id": enr.student_id,
             "student_name": usr.name,
             "user_number": usr.user_number,
             "status": enr.status,
@@ -575,7 +592,7 @@ class EnrollmentService(enrollment_pb2_grpc.EnrollmentServiceServicer):
 
 
 def serve_grpc():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=GRPC_SERVER_OPTIONS)
     enrollment_pb2_grpc.add_EnrollmentServiceServicer_to_server(EnrollmentService(), server)
     server.add_insecure_port(f"[::]:{GRPC_PORT}")
     server.start()
@@ -1,14 +1,23 @@
+import asyncio
+import hashlib
+import itertools
 import logging
 import os
 import sys
 import time
 from pathlib import Path
+from uuid import UUID
 
+import asyncpg
 import grpc
+import grpc.aio
+import jwt
+import orjson
+from cachetools import TLRUCache
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from jose import JWTError, jwt
-from sqlalchemy import create_engine, text
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from google.protobuf.json_format import MessageToDict
 import httpx
 
 BASE_DIR = Path(__file__).resolve().parent  # /app inside container
@@ -20,8 +29,6 @@ if str(PROTO_PATH) not in sys.path:
 
 try:
     from common.protos import (
-        auth_pb2,
-        auth_pb2_grpc,
         course_pb2,
         course_pb2_grpc,
         enrollment_pb2,
@@ -35,16 +42,41 @@ except ImportError as exc:  # pragma: no cover - clarity for missing codegen
     ) from exc
 
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://postgres:postgres@db:5432/enrollment")
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+# Per gateway replica; part of the Postgres connection budget in infra/docker-compose.yml.
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-secret")
 JWT_ALG = os.getenv("JWT_ALG", "HS256")
+# Encode the HMAC key once instead of on every decode.
+_JWT_SECRET_BYTES = JWT_SECRET.encode("utf-8")
+JWT_CACHE_TTL_S = int(os.getenv("JWT_CACHE_TTL_S", "30"))
+JWT_CACHE_MAXSIZE = int(os.getenv("JWT_CACHE_MAXSIZE", "10000"))
 AUTH_HTTP_TARGET = os.getenv("AUTH_HTTP_TARGET", "http://auth-service:8001")
 CURRENT_TERM = os.getenv("CURRENT_TERM", "").strip()
 CURRENT_ACADEMIC_YEAR = os.getenv("CURRENT_ACADEMIC_YEAR", "").strip()
 
-AUTH_GRPC_TARGET = os.getenv("AUTH_GRPC_TARGET", "auth-service:50051")
 COURSE_GRPC_TARGET = os.getenv("COURSE_GRPC_TARGET", "course-service:50052")
 ENROLLMENT_GRPC_TARGET = os.getenv("ENROLLMENT_GRPC_TARGET", "enrollment-service:50053")
 GRADE_GRPC_TARGET = os.getenv("GRADE_GRPC_TARGET", "grade-service:50054")
+# Keep idle connections warm so NAT/conntrack reaping doesn't force a reconnect on the next RPC.
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_receive_message_length", 32 * 1024 * 1024),
+]
+# Connections per upstream; RPCs round-robin across them so one HTTP/2 connection's stream cap isn't the ceiling.
+GRPC_POOL_SIZE = int(os.getenv("GRPC_POOL_SIZE", "4"))
+# How long startup waits for each pooled channel to connect before leaving it to connect lazily.
+GRPC_WARMUP_TIMEOUT_S = float(os.getenv("GRPC_WARMUP_TIMEOUT_S", "5"))
+# Course lookups arriving within this window are coalesced into one BatchGetCourses RPC.
+COURSE_BATCH_WINDOW_S = 0.02
+COURSE_BATCH_MAX_SIZE = 100
+COURSE_BATCH_RPC_TIMEOUT_S = float(os.getenv("COURSE_BATCH_RPC_TIMEOUT_S", "5"))
+# Set when the enrollment and grade schemas share this gateway's Postgres: the course roster is then one
+# JOIN over both schemas instead of two RPCs merged here.
+SINGLE_DB = os.getenv("SINGLE_DB", "0") == "1"
 
 SERVICE_NAME = "gateway"
 logging.basicConfig(
@@ -53,16 +85,91 @@ logging.basicConfig(
 )
 logger = logging.getLogger(SERVICE_NAME)
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# Created on startup; DB access backs the fallback paths (and SINGLE_DB reads), so a missing DB must not block boot.
+db_pool: asyncpg.Pool | None = None
+_db_pool_lock = asyncio.Lock()
+
+# Fixed query text lets asyncpg reuse each connection's prepared statement instead of re-parsing.
+FETCH_COURSES_BASE = """
+    SELECT id, code, title, description, capacity, term, academic_year, section, assigned_faculty_id
+    FROM course_catalog.courses
+"""
+FETCH_COURSES_BY_FACULTY = FETCH_COURSES_BASE + " WHERE assigned_faculty_id = $1"
+FETCH_COURSES_BY_TERM = FETCH_COURSES_BASE + """
+    WHERE ($1::varchar = '' OR term = $1::varchar)
+      AND ($2::varchar = '' OR academic_year = $2::varchar)
+"""
+COUNTS_BY_COURSE = """
+    SELECT course_id, COUNT(*) AS enrolled
+    FROM enrollment.enrollments
+    WHERE status = 'ENROLLED'
+    GROUP BY course_id
+"""
+COURSE_META = """
+    SELECT id, code, title, term, academic_year
+    FROM course_catalog.courses
+    WHERE id = $1
+"""
+COURSE_BY_ID = FETCH_COURSES_BASE + " WHERE id = $1"
+ROSTER_BY_COURSE = """
+    SELECT e.student_id, COALESCE(s.name, '') AS student_name, COALESCE(s.user_number, '') AS user_number, e.status
+    FROM enrollment.enrollments e
+    LEFT JOIN enrollment.students s ON s.id = e.student_id
+    WHERE e.course_id = $1
+"""
+ROSTER_WITH_GRADES_BY_COURSE = """
+    SELECT e.student_id::text AS student_id, COALESCE(s.name, '') AS student_name,
+           COALESCE(s.user_number, '') AS user_number, e.status, g.grade
+    FROM enrollment.enrollments e
+    JOIN enrollment.students s ON s.id = e.student_id
+    LEFT JOIN LATERAL (
+        SELECT grade
+        FROM grade.grades
+        WHERE grade.grades.course_id = e.course_id AND grade.grades.student_id = e.student_id
+        ORDER BY updated_at DESC
+        LIMIT 1
+    ) g ON TRUE
+    WHERE e.course_id = $1
+"""
+# Same mapping as enrollment-service's _status_to_proto, so SINGLE_DB rosters carry the enum ints the RPC path returns.
+ROSTER_STATUS_VALUES = {
+    "ENROLLED": enrollment_pb2.ENROLLED,
+    "WAITLISTED": enrollment_pb2.WAITLISTED,
+    "DROPPED": enrollment_pb2.DROPPED,
+}
+
+class ChannelPool:
+    """A fixed set of channels to one upstream, each with a cached stub, handed out round-robin."""
+
+    def __init__(self, target: str, stub_cls, size: int = GRPC_POOL_SIZE, channel_factory=grpc.insecure_channel):
+        # A distinct channel arg per entry stops gRPC from collapsing them onto one shared subchannel.
+        self.channels = [
+            channel_factory(target, options=GRPC_CHANNEL_OPTIONS + [("grpc.channel_id", i)]) for i in range(size)
+        ]
+        self._stubs = itertools.cycle([stub_cls(channel) for channel in self.channels])
 
-auth_stub = auth_pb2_grpc.AuthServiceStub(grpc.insecure_channel(AUTH_GRPC_TARGET))
-course_stub = course_pb2_grpc.CourseServiceStub(grpc.insecure_channel(COURSE_GRPC_TARGET))
-enrollment_stub = enrollment_pb2_grpc.EnrollmentServiceStub(
-    grpc.insecure_channel(ENROLLMENT_GRPC_TARGET)
-)
-grade_stub = grade_pb2_grpc.GradeServiceStub(grpc.insecure_channel(GRADE_GRPC_TARGET))
+    def next(self):
+        return next(self._stubs)
+
+    async def warm_up(self, timeout: float) -> int:
+        """Connect all (aio) channels concurrently; returns how many were ready within timeout."""
+        results = await asyncio.gather(
+            *(asyncio.wait_for(channel.channel_ready(), timeout) for channel in self.channels),
+            return_exceptions=True,
+        )
+        return sum(result is None for result in results)
 
-app = FastAPI(title="API Gateway", version="0.1.0")
+
+# grpc.aio channels bind to the running event loop, so the pools are created on startup.
+course_pool: ChannelPool | None = None
+enrollment_pool: ChannelPool | None = None
+grade_pool: ChannelPool | None = None
+_course_batch_queue: asyncio.Queue | None = None
+_course_batch_task: asyncio.Task | None = None
+# Strong references to in-flight batch RPCs so they aren't garbage collected mid-call.
+_course_batch_inflight: set[asyncio.Task] = set()
+
+app = FastAPI(title="API Gateway", version="0.1.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -72,7 +179,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-BYPASS_PATHS = {"/api/auth/login", "/health", "/health/db", "/api/ping", "/api/smoke/courses", "/api/courses", "/api/courses/"}
+BYPASS_PATHS = frozenset({"/api/auth/login", "/api/ping", "/api/smoke/courses", "/api/courses", "/api/courses/"})
+# Whole route families that never need a user (liveness/readiness probes hit these constantly).
+BYPASS_PREFIXES = ("/health",)
 
 
 @app.middleware("http")
@@ -96,8 +205,10 @@ async def log_requests(request: Request, call_next):
         duration_ms = (time.perf_counter() - start) * 1000
         logger.exception("%s %s -> unhandled error (%.2f ms)", request.method, request.url.path, duration_ms)
         raise
-    duration_ms = (time.perf_counter() - start) * 1000
-    logger.info("%s %s -> %s (%.2f ms)", request.method, request.url.path, response.status_code, duration_ms)
+    # Success lines are INFO; skip the timing math and URL build entirely when that level is off.
+    if logger.isEnabledFor(logging.INFO):
+        duration_ms = (time.perf_counter() - start) * 1000
+        logger.info("%s %s -> %s (%.2f ms)", request.method, request.url.path, response.status_code, duration_ms)
     return response
 
 
@@ -113,6 +224,62 @@ def grpc_unavailable(service: str, exc: grpc.RpcError):
     raise HTTPException(status_code=503, detail=f"{service} service temporarily unavailable: {detail}")
 
 
+async def get_db_pool() -> asyncpg.Pool:
+    """Return the shared asyncpg pool, creating it lazily if startup could not reach the DB."""
+    global db_pool
+    if db_pool is None:
+        async with _db_pool_lock:
+            if db_pool is None:
+                db_pool = await asyncpg.create_pool(
+                    DATABASE_URL, min_size=DB_POOL_MIN_SIZE, max_size=DB_POOL_MAX_SIZE
+                )
+    return db_pool
+
+
+@app.on_event("startup")
+async def open_db_pool():
+    try:
+        await get_db_pool()
+    except Exception as exc:
+        logger.warning("DB pool not ready at startup; will retry on demand: %s", exc)
+
+
+@app.on_event("shutdown")
+async def close_db_pool():
+    if db_pool is not None:
+        await db_pool.close()
+
+
+@app.on_event("startup")
+async def open_grpc_channels():
+    global course_pool, enrollment_pool, grade_pool, _course_batch_queue, _course_batch_task
+    course_pool = ChannelPool(
+        COURSE_GRPC_TARGET, course_pb2_grpc.CourseServiceStub, channel_factory=grpc.aio.insecure_channel
+    )
+    enrollment_pool = ChannelPool(
+        ENROLLMENT_GRPC_TARGET, enrollment_pb2_grpc.EnrollmentServiceStub, channel_factory=grpc.aio.insecure_channel
+    )
+    grade_pool = ChannelPool(
+        GRADE_GRPC_TARGET, grade_pb2_grpc.GradeServiceStub, channel_factory=grpc.aio.insecure_channel
+    )
+    _course_batch_queue = asyncio.Queue()
+    _course_batch_task = asyncio.create_task(course_batch_worker())
+
+    # Pay the TCP/HTTP2 handshakes now rather than on the first requests; an upstream that is still down
+    # only delays boot by the timeout and its channels keep connecting in the background.
+    pools = {"course": course_pool, "enrollment": enrollment_pool, "grade": grade_pool}
+    ready = await asyncio.gather(*(pool.warm_up(GRPC_WARMUP_TIMEOUT_S) for pool in pools.values()))
+    for (name, pool), count in zip(pools.items(), ready):
+        log_fn = logger.info if count == len(pool.channels) else logger.warning
+        log_fn("%s channels ready at startup: %d/%d", name, count, len(pool.channels))
+
+
+@app.on_event("shutdown")
+async def stop_course_batcher():
+    if _course_batch_task is not None:
+        _course_batch_task.cancel()
+
+
 def course_row_to_dict(row, enrolled_map: dict):
     enrolled = enrolled_map.get(str(row["id"]), 0)
     capacity = row["capacity"] or 0
@@ -131,53 +298,108 @@ def course_row_to_dict(row, enrolled_map: dict):
     }
 
 
-def fetch_courses_from_db(faculty_id: str | None = None):
+def proto_to_dict(message) -> dict:
+    """Convert a response message in one pass, keeping proto field names, empty fields and numeric enums."""
+    return MessageToDict(
+        message,
+        preserving_proto_field_name=True,
+        always_print_fields_with_no_presence=True,
+        use_integers_for_enums=True,
+    )
+
+
+def course_to_dict(course: course_pb2.Course, enrolled_map: dict):
+    data = proto_to_dict(course)
+    enrolled = enrolled_map.get(course.id, 0)
+    data["enrolled"] = enrolled
+    data["available"] = max(course.capacity - enrolled, 0)
+    return data
+
+
+async def fetch_courses_from_db(faculty_id: str | None = None, term: str = "", academic_year: str = ""):
     """Local DB fallback for course metadata when course-service is down."""
     try:
-        query = """
-            SELECT id, code, title, description, capacity, term, academic_year, section, assigned_faculty_id
-            FROM course_catalog.courses
-        """
-        params = {}
-        if faculty_id:
-            query += " WHERE assigned_faculty_id = :faculty_id"
-            params["faculty_id"] = faculty_id
-        with engine.connect() as conn:
-            return conn.execute(text(query), params).mappings().all()
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            if faculty_id:
+                return await conn.fetch(FETCH_COURSES_BY_FACULTY, faculty_id)
+            return await conn.fetch(FETCH_COURSES_BY_TERM, term, academic_year)
     except Exception as exc:
         logger.error("DB fallback for courses failed: %s", exc)
         raise HTTPException(status_code=503, detail="course catalog temporarily unavailable")
 
 
-def fetch_course_metadata(course_id: str):
+async def course_batch_worker():
+    """Drain queued course lookups into windows, each resolved in its own task so a slow batch never stalls the next."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _course_batch_queue.get()]
+        deadline = loop.time() + COURSE_BATCH_WINDOW_S
+        while len(batch) < COURSE_BATCH_MAX_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_course_batch_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        task = asyncio.create_task(resolve_course_batch(batch))
+        _course_batch_inflight.add(task)
+        task.add_done_callback(_course_batch_inflight.discard)
+
+
+async def resolve_course_batch(batch: list[tuple[str, asyncio.Future]]):
+    """Resolve one drained window with a single BatchGetCourses call; every future gets a result or an error."""
+    try:
+        ids = list({course_id for course_id, _ in batch})
+        resp = await course_pool.next().BatchGetCourses(
+            course_pb2.BatchGetCoursesRequest(ids=ids), timeout=COURSE_BATCH_RPC_TIMEOUT_S
+        )
+        found = {str(UUID(c.id)): c for c in resp.courses}
+    except Exception as exc:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+        return
+    for course_id, future in batch:
+        if not future.done():
+            future.set_result(found.get(course_id))
+
+
+async def get_course_meta(course_id: str) -> course_pb2.Course | None:
+    """Look up one course through the coalescing batcher; None when course-service does not know it.
+
+    course_id must parse as a UUID; it is queued in canonical form to match the ids course-service returns.
+    """
+    future = asyncio.get_running_loop().create_future()
+    await _course_batch_queue.put((str(UUID(course_id)), future))
+    return await future
+
+
+async def fetch_course_metadata(course_id: str):
     """Fetch course metadata needed for grade submissions."""
     try:
-        course_resp = course_stub.GetCourse(course_pb2.GetCourseRequest(id=course_id))
+        course_id = str(UUID(str(course_id)))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid course_id")
+    try:
+        course = await get_course_meta(course_id)
+        if course is None:
+            raise HTTPException(status_code=404, detail="Course not found")
         return {
-            "course_id": course_resp.course.id,
-            "course_code": getattr(course_resp.course, "code", ""),
-            "course_name": getattr(course_resp.course, "title", ""),
-            "term": getattr(course_resp.course, "term", ""),
-            "academic_year": getattr(course_resp.course, "academic_year", ""),
+            "course_id": course.id,
+            "course_code": course.code,
+            "course_name": course.title,
+            "term": course.term,
+            "academic_year": course.academic_year,
         }
     except grpc.RpcError as exc:
         log_grpc_error("course", exc)
         try:
-            with engine.connect() as conn:
-                row = (
-                    conn.execute(
-                        text(
-                            """
-                            SELECT id, code, title, term, academic_year
-                            FROM course_catalog.courses
-                            WHERE id = :course_id
-                            """
-                        ),
-                        {"course_id": course_id},
-                    )
-                    .mappings()
-                    .first()
-                )
+            pool = await get_db_pool()
+            async with pool.acquire() as conn:
+                row = await conn.fetchrow(COURSE_META, course_id)
             if not row:
                 raise HTTPException(status_code=404, detail="Course not found")
             return {
@@ -194,29 +416,49 @@ def fetch_course_metadata(course_id: str):
             raise HTTPException(status_code=503, detail="course catalog temporarily unavailable")
 
 
+def _jwt_cache_ttu(_key, user: dict, now: float) -> float:
+    """Expire cached claims after JWT_CACHE_TTL_S, or sooner if the token's own `exp` comes first."""
+    exp = user["raw"].get("exp")
+    if exp is None:
+        return now + JWT_CACHE_TTL_S
+    return now + min(JWT_CACHE_TTL_S, exp - time.time())
+
+
+# Decoded claims by token digest; a hit skips signature verification and JSON parsing entirely.
+_jwt_cache = TLRUCache(maxsize=JWT_CACHE_MAXSIZE, ttu=_jwt_cache_ttu)
+
+
 @app.middleware("http")
 async def jwt_middleware(request: Request, call_next):
-    request.state.user = None
-    if request.url.path in BYPASS_PATHS:
+    # Raw scope path: no URL object is built, and bypassed requests never touch request.state.
+    path = request.scope["path"]
+    if path in BYPASS_PATHS or path.startswith(BYPASS_PREFIXES):
         return await call_next(request)
+    request.state.user = None
 
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
         return await call_next(request)
 
     token = auth_header.split(" ", 1)[1]
-    try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALG])
-        request.state.user = {
+    # Key on a digest so raw bearer tokens are never held in memory beyond the request.
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    user = _jwt_cache.get(cache_key)
+    if user is None:
+        try:
+            payload = jwt.decode(token, _JWT_SECRET_BYTES, algorithms=[JWT_ALG], options={"verify_aud": False})
+        except jwt.PyJWTError:
+            # Invalid token; continue without user info. Protected endpoints will 401.
+            return await call_next(request)
+        user = {
             "user_id": payload.get("sub"),
             "user_number": payload.get("user_number"),
             "email": payload.get("email"),
             "role": payload.get("role"),
             "raw": payload,
         }
-    except JWTError:
-        # Invalid token; continue without user info. Protected endpoints will 401.
-        request.state.user = None
+        _jwt_cache[cache_key] = user
+    request.state.user = user
     return await call_next(request)
 
 
@@ -233,10 +475,11 @@ def health():
 
 
 @app.get("/health/db")
-def health_db():
+async def health_db():
     try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            await conn.execute("SELECT 1")
         return {"status": "ok", "service": "gateway", "db": "connected"}
     except Exception as exc:  # pragma: no cover - simple probe
         return {"status": "error", "service": "gateway", "db": "unreachable", "detail": str(exc)}
@@ -247,34 +490,25 @@ def ping():
     return {"status": "ok", "service": "gateway", "host": os.getenv("HOSTNAME", "gateway")}
 
 
-def enrollment_counts_by_course():
+async def enrollment_counts_by_course():
     """Return a mapping of course_id -> enrolled count for dynamic capacity display."""
     try:
-        with engine.connect() as conn:
-            rows = conn.execute(
-                text(
-                    """
-                    SELECT course_id, COUNT(*) AS enrolled
-                    FROM enrollment.enrollments
-                    WHERE status = 'ENROLLED'
-                    GROUP BY course_id
-                    """
-                )
-            )
-            return {str(row.course_id): row.enrolled for row in rows}
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(COUNTS_BY_COURSE)
+            return {str(row["course_id"]): row["enrolled"] for row in rows}
     except Exception:
         # If enrollment service DB is unreachable, fall back gracefully.
         return {}
 
 
 @app.get("/api/smoke/courses")
-def smoke_courses():
+async def smoke_courses():
     """End-to-end smoke: gateway -> CourseService over gRPC."""
     try:
-        resp = course_stub.ListCourses(course_pb2.ListCoursesRequest())
         courses = [
             {"id": c.id, "code": c.code, "title": c.title, "description": c.description, "capacity": c.capacity}
-            for c in resp.courses
+            async for c in course_pool.next().ListCourses(course_pb2.ListCoursesRequest())
         ]
         return {"status": "ok", "via": "grpc", "courses": courses}
     except grpc.RpcError as exc:
@@ -309,127 +543,78 @@ def me(user=Depends(require_user)):
 course_router = APIRouter(prefix="/api/courses", tags=["courses"])
 
 
+async def stream_course_list(call, first, counts: dict):
+    """Emit `{"courses": [...]}` incrementally while the ListCourses stream is consumed."""
+    yield b'{"courses":['
+    dumps = orjson.dumps
+    sep = b""
+    c = first
+    try:
+        while c is not grpc.aio.EOF:
+            yield sep + dumps(course_to_dict(c, counts))
+            sep = b","
+            c = await call.read()
+    except grpc.RpcError as exc:
+        # Headers are already sent; abort the body rather than return a silently truncated list.
+        log_grpc_error("course", exc)
+        raise
+    yield b"]}"
+
+
 @course_router.get("/")
-def list_courses():
+async def list_courses():
     try:
-        resp = course_stub.ListCourses(course_pb2.ListCoursesRequest())
-        counts = enrollment_counts_by_course()
-        courses = []
-        for c in resp.courses:
-            term = getattr(c, "term", "")
-            ay = getattr(c, "academic_year", "")
-            if CURRENT_TERM and term != CURRENT_TERM:
-                continue
-            if CURRENT_ACADEMIC_YEAR and ay != CURRENT_ACADEMIC_YEAR:
-                continue
-            courses.append(
-                {
-                    "id": c.id,
-                    "code": c.code,
-                    "title": c.title,
-                    "description": c.description,
-                    "capacity": c.capacity,
-                    "term": term,
-                    "academic_year": ay,
-                    "section": getattr(c, "section", ""),
-                    "assigned_faculty_id": getattr(c, "assigned_faculty_id", ""),
-                    "enrolled": counts.get(c.id, 0),
-                    "available": max(c.capacity - counts.get(c.id, 0), 0),
-                }
-            )
-        return {"courses": courses}
+        call = course_pool.next().ListCourses(
+            course_pb2.ListCoursesRequest(term=CURRENT_TERM, academic_year=CURRENT_ACADEMIC_YEAR)
+        )
+        # Read the first message eagerly (so an unreachable course-service still takes the DB fallback)
+        # while the enrollment counts load.
+        counts, first = await asyncio.gather(enrollment_counts_by_course(), call.read())
+        return StreamingResponse(stream_course_list(call, first, counts), media_type="application/json")
     except grpc.RpcError as exc:
         log_grpc_error("course", exc)
-        counts = enrollment_counts_by_course()
-        rows = fetch_courses_from_db()
-        courses = []
-        for row in rows:
-            term = row["term"] or ""
-            ay = row["academic_year"] or ""
-            if CURRENT_TERM and term != CURRENT_TERM:
-                continue
-            if CURRENT_ACADEMIC_YEAR and ay != CURRENT_ACADEMIC_YEAR:
-                continue
-            courses.append(course_row_to_dict(row, counts))
+        counts = await enrollment_counts_by_course()
+        rows = await fetch_courses_from_db(term=CURRENT_TERM, academic_year=CURRENT_ACADEMIC_YEAR)
+        courses = [course_row_to_dict(row, counts) for row in rows]
         return {"courses": courses}
 
 
 @course_router.get("/assigned")
-def list_my_courses(user=Depends(require_user)):
+async def list_my_courses(user=Depends(require_user)):
     """Return courses assigned to the authenticated faculty member."""
     if user.get("role") != "FACULTY":
         raise HTTPException(status_code=403, detail="FACULTY role required")
     try:
-        resp = course_stub.ListFacultyCourses(
-            course_pb2.ListFacultyCoursesRequest(faculty_id=user["user_id"])
+        resp, counts = await asyncio.gather(
+            course_pool.next().ListFacultyCourses(course_pb2.ListFacultyCoursesRequest(faculty_id=user["user_id"])),
+            enrollment_counts_by_course(),
         )
-        counts = enrollment_counts_by_course()
-        courses = [
-            {
-                "id": c.id,
-                "code": c.code,
-                "title": c.title,
-                "description": c.description,
-                "capacity": c.capacity,
-                "term": getattr(c, "term", ""),
-                "academic_year": getattr(c, "academic_year", ""),
-                "section": getattr(c, "section", ""),
-                "assigned_faculty_id": getattr(c, "assigned_faculty_id", ""),
-                "enrolled": counts.get(c.id, 0),
-                "available": max(c.capacity - counts.get(c.id, 0), 0),
-            }
-            for c in resp.courses
-        ]
+        courses = [course_to_dict(c, counts) for c in resp.courses]
         return {"courses": courses}
     except grpc.RpcError as exc:
         log_grpc_error("course", exc)
-        counts = enrollment_counts_by_course()
-        rows = fetch_courses_from_db(faculty_id=user["user_id"])
+        counts = await enrollment_counts_by_course()
+        rows = await fetch_courses_from_db(faculty_id=user["user_id"])
         courses = [course_row_to_dict(row, counts) for row in rows]
         return {"courses": courses}
 
 
 @course_router.get("/{course_id}")
-def get_course(course_id: str):
+async def get_course(course_id: str):
     try:
-        resp = course_stub.GetCourse(course_pb2.GetCourseRequest(id=course_id))
-        c = resp.course
-        counts = enrollment_counts_by_course()
-        enrolled = counts.get(course_id, 0)
-        return {
-            "id": c.id,
-            "code": c.code,
-            "title": c.title,
-            "description": c.description,
-            "capacity": c.capacity,
-            "term": getattr(c, "term", ""),
-            "academic_year": getattr(c, "academic_year", ""),
-            "section": getattr(c, "section", ""),
-            "assigned_faculty_id": getattr(c, "assigned_faculty_id", ""),
-            "enrolled": enrolled,
-            "available": max(c.capacity - enrolled, 0),
-        }
+        resp, counts = await asyncio.gather(
+            course_pool.next().GetCourse(course_pb2.GetCourseRequest(id=course_id)),
+            enrollment_counts_by_course(),
+        )
+        return course_to_dict(resp.course, counts)
     except grpc.RpcError as exc:
         log_grpc_error("course", exc)
-        counts = enrollment_counts_by_course()
-        with engine.connect() as conn:
-            row = (
-                conn.execute(
-                    text(
-                        """
-                        SELECT id, code, title, description, capacity, term, academic_year, section, assigned_faculty_id
-                        FROM course_catalog.courses
-                        WHERE id = :course_id
-                        """
-                    ),
-                    {"course_id": course_id},
-                )
-                .mappings()
-                .first()
-            )
+        counts = await enrollment_counts_by_course()
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(COURSE_BY_ID, course_id)
         if not row:
             raise HTTPException(status_code=404, detail="Course not found")
-        enrolled = counts.get(course_id, 0)
         return course_row_to_dict(row, counts)
 
 
@@ -438,11 +623,11 @@ enrollment_router = APIRouter(prefix="/api/enrollments", tags=["enrollments"])
 
 
 @enrollment_router.post("/")
-def enroll(body: dict, user=Depends(require_user)):
+async def enroll(body: dict, user=Depends(require_user)):
     if user.get("role") == "FACULTY":
         raise HTTPException(status_code=403, detail="Faculty cannot enroll in courses")
     try:
-        resp = enrollment_stub.Enroll(
+        resp = await enrollment_pool.next().Enroll(
             enrollment_pb2.EnrollRequest(
                 student_id=user["user_id"],
                 course_id=body.get("course_id", ""),
@@ -462,11 +647,11 @@ def enroll(body: dict, user=Depends(require_user)):
 
 
 @enrollment_router.delete("/{enrollment_id}")
-def drop(enrollment_id: str, user=Depends(require_user)):
+async def drop(enrollment_id: str, user=Depends(require_user)):
     if user.get("role") == "FACULTY":
         raise HTTPException(status_code=403, detail="Faculty cannot drop enrollments")
     try:
-        resp = enrollment_stub.ListStudentEnrollments(
+        resp = await enrollment_pool.next().ListStudentEnrollments(
             enrollment_pb2.ListStudentEnrollmentsRequest(student_id=user["user_id"])
         )
     except grpc.RpcError as exc:
@@ -477,7 +662,7 @@ def drop(enrollment_id: str, user=Depends(require_user)):
         raise HTTPException(status_code=404, detail="Enrollment not found")
 
     try:
-        drop_resp = enrollment_stub.DropEnrollment(
+        drop_resp = await enrollment_pool.next().DropEnrollment(
             enrollment_pb2.DropEnrollmentRequest(enrollment_id=enrollment_id)
         )
     except grpc.RpcError as exc:
@@ -500,76 +685,87 @@ def drop(enrollment_id: str, user=Depends(require_user)):
 
 
 @enrollment_router.get("/my")
-def list_my_enrollments(user=Depends(require_user)):
+async def list_my_enrollments(user=Depends(require_user)):
     try:
-        resp = enrollment_stub.ListStudentEnrollments(
+        resp = await enrollment_pool.next().ListStudentEnrollments(
             enrollment_pb2.ListStudentEnrollmentsRequest(student_id=user["user_id"])
         )
         enrollments = []
         for e in resp.enrollments:
-            term = getattr(e, "term", "")
-            ay = getattr(e, "academic_year", "")
             if e.status == enrollment_pb2.DROPPED:
                 continue
-            if CURRENT_TERM and term != CURRENT_TERM:
+            if CURRENT_TERM and e.term != CURRENT_TERM:
                 continue
-            if CURRENT_ACADEMIC_YEAR and ay != CURRENT_ACADEMIC_YEAR:
+            if CURRENT_ACADEMIC_YEAR and e.academic_year != CURRENT_ACADEMIC_YEAR:
                 continue
-            enrollments.append(
-                {
-                    "id": e.id,
-                    "student_id": e.student_id,
-                    "course_id": e.course_id,
-                    "status": e.status,
-                    "term": term,
-                    "academic_year": ay,
-                }
-            )
+            enrollments.append(proto_to_dict(e))
         return {"enrollments": enrollments}
     except grpc.RpcError as exc:
         grpc_unavailable("enrollment", exc)
 
 
+async def course_grade_map(course_id: str) -> dict:
+    """student_id -> grade for a course, read off the ListCourseGrades stream."""
+    call = grade_pool.next().ListCourseGrades(grade_pb2.ListCourseGradesRequest(course_id=course_id))
+    return {g.student_id: g.grade async for g in call}
+
+
 @enrollment_router.get("/course/{course_id}/roster")
-def course_roster(course_id: str, user=Depends(require_user)):
+async def course_roster(course_id: str, user=Depends(require_user)):
     """Return enrolled students (UUID + number + name) for a course; faculty only."""
     if user.get("role") != "FACULTY":
         raise HTTPException(status_code=403, detail="FACULTY role required")
+    if SINGLE_DB:
+        try:
+            pool = await get_db_pool()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(ROSTER_WITH_GRADES_BY_COURSE, course_id)
+            roster = [
+                {
+                    "student_id": r["student_id"],
+                    "student_name": r["student_name"],
+                    "user_number": r["user_number"],
+                    "status": ROSTER_STATUS_VALUES.get(r["status"], enrollment_pb2.ENROLLMENT_STATUS_UNSPECIFIED),
+                    "grade": r["grade"],
+                }
+                for r in rows
+            ]
+            return {"roster": roster, "grades_available": True}
+        except Exception as exc:
+            logger.error("Roster join query failed, falling back to services: %s", exc)
+    # Roster and existing grades (no dependency on course service) are independent; fetch them concurrently.
+    roster_result, grades_result = await asyncio.gather(
+        enrollment_pool.next().ListCourseRoster(enrollment_pb2.ListCourseRosterRequest(course_id=course_id)),
+        course_grade_map(course_id),
+        return_exceptions=True,
+    )
+
     roster_resp = None
     roster_rows = []
-    try:
-        roster_resp = enrollment_stub.ListCourseRoster(enrollment_pb2.ListCourseRosterRequest(course_id=course_id))
-    except grpc.RpcError as exc:
-        log_grpc_error("enrollment", exc)
+    if isinstance(roster_result, grpc.RpcError):
+        log_grpc_error("enrollment", roster_result)
         # Fallback: pull roster directly from DB if enrollment-service is unavailable.
         try:
-            with engine.connect() as conn:
-                roster_rows = list(
-                    conn.execute(
-                        text(
-                            """
-                            SELECT e.student_id, COALESCE(s.name, '') AS student_name, COALESCE(s.user_number, '') AS user_number, e.status
-                            FROM enrollment.enrollments e
-                            LEFT JOIN enrollment.students s ON s.id = e.student_id
-                            WHERE e.course_id = :course_id
-                            """
-                        ),
-                        {"course_id": course_id},
-                    ).mappings()
-                )
+            pool = await get_db_pool()
+            async with pool.acquire() as conn:
+                roster_rows = await conn.fetch(ROSTER_BY_COURSE, course_id)
         except Exception as db_exc:
             logger.error("Roster DB fallback failed: %s", db_exc)
             raise HTTPException(status_code=503, detail="Roster temporarily unavailable") from db_exc
+    elif isinstance(roster_result, BaseException):
+        raise roster_result
+    else:
+        roster_resp = roster_result
 
     grades_available = True
     grade_map = {}
-    try:
-        # Fetch existing grades for this course (no dependency on course service)
-        grades_resp = grade_stub.ListCourseGrades(grade_pb2.ListCourseGradesRequest(course_id=course_id))
-        grade_map = {g.student_id: g.grade for g in grades_resp.grades}
-    except grpc.RpcError as exc:
+    if isinstance(grades_result, grpc.RpcError):
         grades_available = False
-        log_grpc_error("grade", exc)
+        log_grpc_error("grade", grades_result)
+    elif isinstance(grades_result, BaseException):
+        raise grades_result
+    else:
+        grade_map = grades_result
 
     if roster_resp:
         roster = [
@@ -602,39 +798,30 @@ grade_router = APIRouter(prefix="/api/grades", tags=["grades"])
 
 
 @grade_router.get("/my")
-def list_my_grades(user=Depends(require_user)):
+async def list_my_grades(user=Depends(require_user)):
     try:
-        resp = grade_stub.ListStudentTermGrades(grade_pb2.ListStudentTermGradesRequest(student_id=user["user_id"]))
-        groups = [
-            {
-                "academic_year": grp.academic_year,
-                "term": grp.term,
-                "courses": [
-                    {
-                        "course_id": c.course_id,
-                        "course_code": c.course_code,
-                        "course_name": c.course_name,
-                        "grade": c.grade or None,
-                    }
-                    for c in grp.courses
-                ],
-            }
-            for grp in resp.groups
-        ]
+        resp = await grade_pool.next().ListStudentTermGrades(
+            grade_pb2.ListStudentTermGradesRequest(student_id=user["user_id"])
+        )
+        groups = proto_to_dict(resp)["groups"]
+        for grp in groups:
+            for c in grp["courses"]:
+                # Ungraded courses are reported as null, not "".
+                c["grade"] = c["grade"] or None
         return {"groups": groups}
     except grpc.RpcError as exc:
         grpc_unavailable("grade", exc)
 
 
 @grade_router.post("/")
-def submit_grade(body: dict, user=Depends(require_user)):
+async def submit_grade(body: dict, user=Depends(require_user)):
     """Single-grade submission (legacy); expects UUIDs and academic year."""
     if user.get("role") != "FACULTY":
         raise HTTPException(status_code=403, detail="FACULTY role required")
     course_id = body.get("course_id", "")
-    course_meta = fetch_course_metadata(course_id)
+    course_meta = await fetch_course_metadata(course_id)
     try:
-        resp = grade_stub.SubmitGrade(
+        resp = await grade_pool.next().SubmitGrade(
             grade_pb2.SubmitGradeRequest(
                 student_id=body.get("student_id", ""),
                 course_id=course_id,
@@ -661,17 +848,17 @@ def submit_grade(body: dict, user=Depends(require_user)):
 
 
 @grade_router.post("/bulk")
-def submit_grades(body: dict, user=Depends(require_user)):
+async def submit_grades(body: dict, user=Depends(require_user)):
     """Bulk upsert of grades for a course/term/academic year using UUIDs."""
     if user.get("role") != "FACULTY":
         raise HTTPException(status_code=403, detail="FACULTY role required")
     course_id = body.get("course_id", "")
-    course_meta = fetch_course_metadata(course_id)
+    course_meta = await fetch_course_metadata(course_id)
     term = body.get("term", "") or course_meta["term"]
     academic_year = body.get("academic_year", "") or course_meta["academic_year"]
     records = body.get("records", [])
     try:
-        resp = grade_stub.SubmitGrades(
+        resp = await grade_pool.next().SubmitGrades(
             grade_pb2.SubmitGradesRequest(
                 course_id=course_id,
                 course_code=course_meta["course_code"],
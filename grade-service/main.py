@@ -1,20 +1,21 @@
-import concurrent.futures as futures
 import logging
 import os
 import sys
-import threading
 import time
+from itertools import groupby
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from uuid import uuid4
+from uuid import UUID as PyUUID
 
 import grpc
-from fastapi import Depends, FastAPI, HTTPException, Request
+import grpc.aio
+from cachetools import TTLCache
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import Column, String, Text, create_engine, text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import make_url, text
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 BASE_DIR = Path(__file__).resolve().parent
 ROOT_DIR = BASE_DIR.parent
@@ -31,30 +32,39 @@ except ImportError as exc:  # pragma: no cover
 
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://postgres:postgres@db:5432/enrollment")
 GRPC_PORT = int(os.getenv("GRADE_GRPC_PORT", "50054"))
-engine = create_engine(
-    DATABASE_URL,
+# Let idle gateway channels keep their 30s keepalive pings without tripping GOAWAY "too_many_pings",
+# and ping them from this side too so half-open connections are torn down.
+GRPC_SERVER_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_ping_interval_without_data_ms", 10000),
+    ("grpc.max_concurrent_streams", 1000),
+    # Every uvicorn worker starts its own server on GRPC_PORT; the kernel spreads connections across them.
+    ("grpc.so_reuseport", 1),
+]
+# Per uvicorn worker, shared by gRPC calls and REST handlers on one event loop; workers * DB_POOL_SIZE is this
+# service's share of the Postgres connection budget (see infra/docker-compose.yml). No overflow: bursts wait
+# for a connection instead of pushing past max_connections. LIFO keeps checkouts on the warm connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "0"))
+# Same database, asyncpg driver; DATABASE_URL stays the plain postgresql:// URL the other services use.
+engine = create_async_engine(
+    make_url(DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=1800,
+    # Behind HAProxy (30m idle timeout, primary/backup switch): ping on checkout so a connection killed by a
+    # timeout, failover or DB restart is replaced instead of failing a real request.
     pool_pre_ping=True,
-    connect_args={"options": "-c search_path=grade,public"},
+    pool_use_lifo=True,
+    connect_args={"server_settings": {"search_path": "grade,public"}},
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 
-class Grade(Base):
-    __tablename__ = "grades"
-    __table_args__ = {"schema": "grade"}
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    student_id = Column(UUID(as_uuid=True), nullable=False)
-    course_id = Column(UUID(as_uuid=True), nullable=True)
-    course_code = Column(String(64), nullable=False)
-    course_name = Column(Text, nullable=False)
-    term = Column(String(32), nullable=False)
-    academic_year = Column(String(32), nullable=False, default="")
-    grade = Column(Text, nullable=False)
-
-
-app = FastAPI(title="Grade Service", version="0.1.0")
+app = FastAPI(title="Grade Service", version="0.1.0", default_response_class=ORJSONResponse)
 SERVICE_NAME = "grade-service"
 logging.basicConfig(
     level=logging.INFO,
@@ -87,19 +97,6 @@ class BulkGradeIn(BaseModel):
     records: List[StudentGradeIn]
 
 
-class TermCourseGrade(BaseModel):
-    course_id: str | None = None
-    course_code: str
-    course_name: str
-    grade: str | None = None
-
-
-class TermGradesGroup(BaseModel):
-    academic_year: str
-    term: str
-    courses: List[TermCourseGrade]
-
-
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     start = time.perf_counter()
@@ -121,21 +118,38 @@ async def log_requests(request: Request, call_next):
         duration_ms = (time.perf_counter() - start) * 1000
         logger.exception("%s %s -> unhandled error (%.2f ms)", request.method, request.url.path, duration_ms)
         raise
-    duration_ms = (time.perf_counter() - start) * 1000
-    logger.info("%s %s -> %s (%.2f ms)", request.method, request.url.path, response.status_code, duration_ms)
+    # Success lines are INFO; skip the timing math and URL build entirely when that level is off.
+    if logger.isEnabledFor(logging.INFO):
+        duration_ms = (time.perf_counter() - start) * 1000
+        logger.info("%s %s -> %s (%.2f ms)", request.method, request.url.path, response.status_code, duration_ms)
     return response
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def resolve_course_metadata(
-    db: Session, *, course_id: Optional[str], course_code: Optional[str], course_name: Optional[str]
+# course_id -> (course_code, course_name) as last read from grade.grades, so bursts of submissions that omit them
+# skip the latest-grade lookup. Each uvicorn worker has its own copy and a rename may land on another worker, so
+# only DB reads are cached, for a few seconds, and this worker evicts the entry whenever it writes the course.
+# REST and gRPC handlers all run on the one event loop, so no lock is needed.
+_course_metadata_cache: TTLCache = TTLCache(maxsize=1024, ttl=5)
+
+
+LATEST_COURSE_METADATA = text(
+    """
+    SELECT course_code, course_name
+    FROM grade.grades
+    WHERE course_id = :course_id
+    ORDER BY updated_at DESC
+    LIMIT 1
+    """
+)
+
+
+async def resolve_course_metadata(
+    db: AsyncSession, *, course_id: Optional[str], course_code: Optional[str], course_name: Optional[str]
 ) -> Tuple[Optional[str], str, str]:
     """Return course metadata to persist, reusing prior records when possible."""
     code = (course_code or "").strip()
@@ -144,23 +158,13 @@ def resolve_course_metadata(
         return course_id, code, name
 
     if course_id:
-        existing = (
-            db.execute(
-                text(
-                    """
-                    SELECT course_code, course_name
-                    FROM grade.grades
-                    WHERE course_id = :course_id
-                    ORDER BY updated_at DESC
-                    LIMIT 1
-                    """
-                ),
-                {"course_id": course_id},
-            )
-            .mappings()
-            .first()
-        )
+        cached = _course_metadata_cache.get(course_id)
+        if cached:
+            return course_id, *cached
+        result = await db.execute(LATEST_COURSE_METADATA, {"course_id": course_id})
+        existing = result.mappings().first()
         if existing:
+            _course_metadata_cache[course_id] = (existing["course_code"], existing["course_name"])
             return course_id, existing["course_code"], existing["course_name"]
 
     raise HTTPException(status_code=400, detail="course_code and course_name are required for grade submissions")
@@ -169,9 +173,9 @@ def resolve_course_metadata(
 def grade_row_to_dict(row) -> Dict[str, str]:
     """Normalize a grade row mapping for JSON responses."""
     return {
-        "id": str(row["id"]),
-        "student_id": str(row["student_id"]),
-        "course_id": str(row["course_id"]) if row.get("course_id") else None,
+        "id": row["id"],
+        "student_id": row["student_id"],
+        "course_id": row["course_id"],
         "course_code": row["course_code"],
         "course_name": row["course_name"],
         "term": row["term"],
@@ -181,20 +185,89 @@ def grade_row_to_dict(row) -> Dict[str, str]:
 
 
 def grade_row_to_proto(row) -> grade_pb2.GradeRecord:
-    return grade_pb2.GradeRecord(
-        id=str(row["id"]),
-        student_id=str(row["student_id"]),
-        course_id=str(row["course_id"]) if row.get("course_id") else "",
-        course_code=row["course_code"],
-        course_name=row["course_name"],
-        term=row["term"],
-        academic_year=row["academic_year"],
-        grade=row["grade"],
-    )
+    # Plain attribute assignment skips the keyword-argument path of the message constructor.
+    record = grade_pb2.GradeRecord()
+    record.id = row["id"]
+    record.student_id = row["student_id"]
+    if row["course_id"]:
+        record.course_id = row["course_id"]
+    record.course_code = row["course_code"]
+    record.course_name = row["course_name"]
+    record.term = row["term"]
+    record.academic_year = row["academic_year"]
+    record.grade = row["grade"]
+    return record
+
+
+# Column order shared by every grade SELECT/RETURNING and grade_tuple_to_proto. UUIDs come back as
+# text so rows drop straight into the string fields of the JSON/proto responses.
+GRADE_COLUMNS = (
+    "id::text AS id, student_id::text AS student_id, course_id::text AS course_id, "
+    "course_code, course_name, term, academic_year, grade"
+)
+GRADES_BY_STUDENT = text(f"SELECT {GRADE_COLUMNS} FROM grade.grades WHERE student_id = :student_id")
 
 
-def ensure_schema():
-    """Apply lightweight, idempotent DDL so course metadata columns exist."""
+def grade_tuple_to_proto(row: tuple) -> grade_pb2.GradeRecord:
+    """Same as grade_row_to_proto for a plain row tuple in GRADE_COLUMNS order."""
+    grade_id, student_id, course_id, course_code, course_name, term, academic_year, grade = row
+    record = grade_pb2.GradeRecord()
+    record.id = grade_id
+    record.student_id = student_id
+    if course_id:
+        record.course_id = course_id
+    record.course_code = course_code
+    record.course_name = course_name
+    record.term = term
+    record.academic_year = academic_year
+    record.grade = grade
+    return record
+
+
+# Upper bound on one page of grades when a caller asks for paging.
+GRADE_PAGE_MAX = int(os.getenv("GRADE_PAGE_MAX", "1000"))
+
+
+def grade_page_sql(where: str, params: dict, limit: int, page_token: str) -> str:
+    """Build a grade SELECT with optional keyset paging on id (page_token = last id already returned).
+
+    limit <= 0 with no page_token keeps the unbounded listing; limit is clamped to GRADE_PAGE_MAX.
+    Raises ValueError when page_token is not a grade id.
+    """
+    # ORDER BY is table-qualified: a bare "id" would sort by the text alias in GRADE_COLUMNS, not the indexed uuid.
+    order = ""
+    if page_token:
+        params["page_token"] = str(PyUUID(page_token))
+        where += " AND id > :page_token"
+        order = " ORDER BY grades.id"
+    if limit > 0:
+        params["limit"] = min(limit, GRADE_PAGE_MAX)
+        order = " ORDER BY grades.id LIMIT :limit"
+    return f"""
+        SELECT {GRADE_COLUMNS}
+        FROM grade.grades
+        WHERE {where}{order}
+    """
+
+
+# Newest academic year (by its starting year) and term first, then course code/name within a term.
+# The raw academic_year/term keep each group contiguous. Shared by get_student_term_grades and the
+# expression index that backs it; blank or non-numeric years/terms sort last. numeric (not int) so an
+# arbitrarily long digit run in the free-text academic_year can never overflow and fail the write.
+TERM_GRADES_ORDER = (
+    "((substring(academic_year from '[0-9]+'))::numeric) DESC NULLS LAST, "
+    "((substring(term from '^[0-9]+(?:\\.[0-9]+)?$'))::numeric) DESC NULLS LAST, "
+    "academic_year, term, course_code, course_name"
+)
+
+# Bump whenever the ensure_schema statements change so existing databases re-apply them once.
+GRADE_SCHEMA_VERSION = 4
+# Serializes ensure_schema across uvicorn workers/replicas sharing one database.
+GRADE_SCHEMA_LOCK = "grade_schema"
+
+
+async def ensure_schema():
+    """Apply lightweight, idempotent DDL so course metadata columns exist (once per schema version)."""
     statements = [
         "ALTER TABLE grade.grades ADD COLUMN IF NOT EXISTS course_code VARCHAR(64);",
         "ALTER TABLE grade.grades ADD COLUMN IF NOT EXISTS course_name TEXT;",
@@ -211,143 +284,175 @@ def ensure_schema():
         "ALTER TABLE grade.grades DROP CONSTRAINT IF EXISTS grades_student_id_course_id_term_key;",
         "CREATE UNIQUE INDEX IF NOT EXISTS uq_grades_student_course_term_year ON grade.grades (student_id, course_code, term, academic_year);",
         "CREATE INDEX IF NOT EXISTS idx_grades_course_code ON grade.grades (course_code);",
+        # Rebuilt so databases created with the earlier ::int expression pick up TERM_GRADES_ORDER as it is now.
+        "DROP INDEX IF EXISTS grade.idx_grades_student_term_order;",
+        f"CREATE INDEX IF NOT EXISTS idx_grades_student_term_order ON grade.grades (student_id, {TERM_GRADES_ORDER});",
+        # Covering listing indexes supersede the single-column student/course ones.
+        "CREATE INDEX IF NOT EXISTS idx_grades_student_id_covering ON grade.grades (student_id, id) "
+        "INCLUDE (course_id, course_code, course_name, term, academic_year, grade);",
+        "CREATE INDEX IF NOT EXISTS idx_grades_course_term_year_covering ON grade.grades (course_id, term, academic_year, id) "
+        "INCLUDE (student_id, course_code, course_name, grade);",
+        "DROP INDEX IF EXISTS grade.idx_grades_student;",
+        "DROP INDEX IF EXISTS grade.idx_grades_course;",
+        "ANALYZE grade.grades;",
     ]
     try:
-        with engine.begin() as conn:
+        async with engine.begin() as conn:
+            # Transaction-scoped: the first worker applies the DDL, the rest wait here and then see the new version.
+            await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:lock))"), {"lock": GRADE_SCHEMA_LOCK})
+            await conn.execute(text("CREATE TABLE IF NOT EXISTS grade.schema_version (version INT PRIMARY KEY);"))
+            current = (await conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM grade.schema_version"))).scalar()
+            if current >= GRADE_SCHEMA_VERSION:
+                return
             for stmt in statements:
-                conn.execute(text(stmt))
+                await conn.execute(text(stmt))
+            await conn.execute(
+                text("INSERT INTO grade.schema_version (version) VALUES (:version) ON CONFLICT (version) DO NOTHING"),
+                {"version": GRADE_SCHEMA_VERSION},
+            )
+            logger.info("Applied grade schema version %s", GRADE_SCHEMA_VERSION)
     except Exception:  # pragma: no cover - guard rails for startup
         logger.exception("Failed to ensure grade schema is up to date")
         raise
 
 
-def parse_academic_year_start(academic_year: str) -> int:
-    if not academic_year:
-        return -1
-    for part in academic_year.replace("–", "-").split("-"):
-        if part.isdigit():
-            return int(part)
-    return -1
-
-
-def get_student_term_grades(student_id: str, db: Session) -> List[TermGradesGroup]:
-    """Return all grade records grouped by term/year, using only local DB state."""
-    rows = db.execute(
-        text(
-            """
-            SELECT id, student_id, course_id, course_code, course_name, term, academic_year, grade
-            FROM grade.grades
-            WHERE student_id = :student_id
-            """
-        ),
-        {"student_id": student_id},
-    ).mappings()
-
-    grouped: Dict[Tuple[str, str], List[TermCourseGrade]] = {}
-    for row in rows:
-        ay = row["academic_year"] or ""
-        term = row["term"] or ""
-        grouped.setdefault((ay, term), []).append(
-            TermCourseGrade(
-                course_id=str(row["course_id"]) if row["course_id"] else None,
-                course_code=row["course_code"] or "",
-                course_name=row["course_name"] or "",
-                grade=row["grade"],
-            )
-        )
+TERM_GRADES_BY_STUDENT = text(
+    f"""
+    SELECT course_id::text AS course_id, course_code, course_name, term, academic_year, grade
+    FROM grade.grades
+    WHERE student_id = :student_id
+    ORDER BY {TERM_GRADES_ORDER}
+    """
+)
 
-    sorted_groups = []
-    for (ay, term), courses in grouped.items():
-        courses_sorted = sorted(courses, key=lambda c: (c.course_code, c.course_name))
-        sorted_groups.append((ay, term, courses_sorted))
-    sorted_groups.sort(
-        key=lambda item: (parse_academic_year_start(item[0]), float(item[1] or 0.0)),
-        reverse=True,
-    )
 
-    return [TermGradesGroup(academic_year=ay, term=term, courses=courses) for ay, term, courses in sorted_groups]
+async def get_student_term_grades(student_id: str, db: AsyncSession) -> List[dict]:
+    """Return all grade records grouped by term/year (newest first), using only local DB state.
+
+    Groups are plain dicts shaped like the /grades/terms JSON, so REST returns them as-is.
+    """
+    rows = (await db.execute(TERM_GRADES_BY_STUDENT, {"student_id": student_id})).mappings()
+
+    # Rows arrive ordered by group, so each (academic_year, term) run is one group.
+    return [
+        {
+            "academic_year": ay,
+            "term": term,
+            "courses": [
+                {
+                    "course_id": row["course_id"],
+                    "course_code": row["course_code"] or "",
+                    "course_name": row["course_name"] or "",
+                    "grade": row["grade"],
+                }
+                for row in group
+            ],
+        }
+        for (ay, term), group in groupby(rows, key=lambda r: (r["academic_year"] or "", r["term"] or ""))
+    ]
 
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok", "service": "grade-service"}
 
 
 @app.get("/health/db")
-def health_db():
+async def health_db():
     try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
         return {"status": "ok", "service": "grade-service", "db": "connected"}
     except Exception as exc:  # pragma: no cover - simple probe
         return {"status": "error", "service": "grade-service", "db": "unreachable", "detail": str(exc)}
 
 
 # ---------- REST endpoints ----------
-def upsert_grade(
-    db: Session,
+# One fixed statement for any batch size: the per-student values travel as two parallel arrays, so the
+# SQL text (and asyncpg's prepared statement for it) is reused instead of growing a VALUES row per record.
+UPSERT_GRADES = text(
+    f"""
+    INSERT INTO grade.grades (student_id, course_id, course_code, course_name, term, academic_year, grade)
+    SELECT r.student_id, CAST(:course_id AS uuid), :course_code, :course_name, :term, :academic_year, r.grade
+    FROM unnest(CAST(:student_ids AS uuid[]), CAST(:grades AS text[])) AS r (student_id, grade)
+    ON CONFLICT (student_id, course_code, term, academic_year)
+    DO UPDATE SET grade = EXCLUDED.grade,
+                  course_name = EXCLUDED.course_name,
+                  course_id = COALESCE(EXCLUDED.course_id, grade.grades.course_id),
+                  updated_at = NOW()
+    RETURNING {GRADE_COLUMNS}
+    """
+)
+
+
+async def upsert_grades(
+    db: AsyncSession,
     *,
-    student_id: str,
     course_id: Optional[str],
     course_code: Optional[str],
     course_name: Optional[str],
     term: str,
     academic_year: str,
-    grade: str,
+    records: List[Tuple[str, str]],
 ):
-    """Insert or update a grade for a student/course/term."""
-    course_id, resolved_code, resolved_name = resolve_course_metadata(
+    """Insert or update (student_id, grade) pairs for one course/term in a single statement and commit."""
+    if not records:
+        return []
+    course_id, resolved_code, resolved_name = await resolve_course_metadata(
         db, course_id=course_id, course_code=course_code, course_name=course_name
     )
-    term = term or ""
-    academic_year = academic_year or ""
+    # ON CONFLICT cannot touch the same row twice in one statement; keep the last grade per student,
+    # which is what the old one-upsert-per-record loop ended up persisting.
+    latest = dict(records)
+    params = {
+        "student_ids": list(latest),
+        "grades": list(latest.values()),
+        "course_id": course_id,
+        "course_code": resolved_code,
+        "course_name": resolved_name,
+        "term": term or "",
+        "academic_year": academic_year or "",
+    }
     try:
-        row = (
-            db.execute(
-                text(
-                    """
-                    INSERT INTO grade.grades (
-                        student_id,
-                        course_id,
-                        course_code,
-                        course_name,
-                        term,
-                        academic_year,
-                        grade
-                    )
-                    VALUES (:student_id, :course_id, :course_code, :course_name, :term, :academic_year, :grade)
-                    ON CONFLICT (student_id, course_code, term, academic_year)
-                    DO UPDATE SET grade = EXCLUDED.grade,
-                                  course_name = EXCLUDED.course_name,
-                                  course_id = COALESCE(EXCLUDED.course_id, grade.grades.course_id),
-                                  updated_at = NOW()
-                    RETURNING id, student_id, course_id, course_code, course_name, term, academic_year, grade
-                    """
-                ),
-                {
-                    "student_id": student_id,
-                    "course_id": course_id,
-                    "course_code": resolved_code,
-                    "course_name": resolved_name,
-                    "term": term,
-                    "academic_year": academic_year,
-                    "grade": grade,
-                },
-            )
-            .mappings()
-            .first()
-        )
-        db.commit()
-        return row
+        result = await db.execute(UPSERT_GRADES, params)
+        rows = result.mappings().all()
+        await db.commit()
+        if course_id:
+            _course_metadata_cache.pop(course_id, None)
+        return rows
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise
 
 
+async def upsert_grade(
+    db: AsyncSession,
+    *,
+    student_id: str,
+    course_id: Optional[str],
+    course_code: Optional[str],
+    course_name: Optional[str],
+    term: str,
+    academic_year: str,
+    grade: str,
+):
+    """Insert or update a grade for a student/course/term."""
+    rows = await upsert_grades(
+        db,
+        course_id=course_id,
+        course_code=course_code,
+        course_name=course_name,
+        term=term,
+        academic_year=academic_year,
+        records=[(student_id, grade)],
+    )
+    return rows[0]
+
+
 @app.post("/grades")
-def submit_grade(body: GradeIn, db: Session = Depends(get_db)):
+async def submit_grade(body: GradeIn, db: AsyncSession = Depends(get_db)):
     try:
-        rec = upsert_grade(
+        rec = await upsert_grade(
             db,
             student_id=body.student_id,
             course_id=body.course_id,
@@ -363,217 +468,184 @@ def submit_grade(body: GradeIn, db: Session = Depends(get_db)):
 
 
 @app.post("/grades/bulk")
-def submit_grades(body: BulkGradeIn, db: Session = Depends(get_db)):
+async def submit_grades(body: BulkGradeIn, db: AsyncSession = Depends(get_db)):
     """Bulk upsert grades for a course/term/academic_year."""
-    results = []
-    for record in body.records:
-        try:
-            rec = upsert_grade(
-                db,
-                student_id=record.student_id,
-                course_id=body.course_id,
-                course_code=body.course_code,
-                course_name=body.course_name,
-                term=body.term,
-                academic_year=body.academic_year,
-                grade=record.grade,
-            )
-        except IntegrityError:
-            raise HTTPException(status_code=409, detail="Duplicate grade for student/course/term")
-        results.append(grade_row_to_dict(rec))
-    return {"grades": results}
+    try:
+        rows = await upsert_grades(
+            db,
+            course_id=body.course_id,
+            course_code=body.course_code,
+            course_name=body.course_name,
+            term=body.term,
+            academic_year=body.academic_year,
+            records=[(record.student_id, record.grade) for record in body.records],
+        )
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Duplicate grade for student/course/term")
+    return {"grades": [grade_row_to_dict(rec) for rec in rows]}
 
 
 @app.get("/grades")
-def list_grades(student_id: str, db: Session = Depends(get_db)):
-    rows = db.query(Grade).filter(Grade.student_id == student_id).all()
-    return [
-        {
-            "id": str(g.id),
-            "student_id": str(g.student_id),
-            "course_id": str(g.course_id) if g.course_id else None,
-            "course_code": g.course_code,
-            "course_name": g.course_name,
-            "term": g.term,
-            "academic_year": g.academic_year,
-            "grade": g.grade,
-        }
-        for g in rows
-    ]
+async def list_grades(
+    student_id: str,
+    limit: int = Query(0, ge=0),
+    page_token: str = "",
+    db: AsyncSession = Depends(get_db),
+):
+    """List a student's grades; pass limit and the last returned id as page_token to page through them."""
+    params = {"student_id": student_id}
+    try:
+        sql = grade_page_sql("student_id = :student_id", params, limit, page_token)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid page_token")
+    rows = (await db.execute(text(sql), params)).mappings()
+    return [grade_row_to_dict(row) for row in rows]
 
 
 @app.get("/grades/terms")
-def list_grades_by_term(student_id: str, db: Session = Depends(get_db)):
+async def list_grades_by_term(student_id: str, db: AsyncSession = Depends(get_db)):
     """Grouped grades/enrollments for a student across all terms."""
-    groups = get_student_term_grades(student_id, db)
-    return {"groups": [g.dict() for g in groups]}
+    groups = await get_student_term_grades(student_id, db)
+    return {"groups": groups}
 
 
 # ---------- gRPC service ----------
 class GradeService(grade_pb2_grpc.GradeServiceServicer):
-    def SubmitGrade(self, request, context):
-        db = SessionLocal()
-        try:
-            rec = upsert_grade(
-                db,
-                student_id=request.student_id,
-                course_id=request.course_id or None,
-                course_code=request.course_code or None,
-                course_name=request.course_name or None,
-                term=request.term,
-                academic_year=request.academic_year,
-                grade=request.grade,
-            )
-            return grade_pb2.SubmitGradeResponse(record=grade_row_to_proto(rec))
-        except HTTPException as exc:
-            db.rollback()
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(exc.detail))
-            return grade_pb2.SubmitGradeResponse()
-        except IntegrityError:
-            db.rollback()
-            context.set_code(grpc.StatusCode.ALREADY_EXISTS)
-            context.set_details("Grade already exists for student/course/term")
-            return grade_pb2.SubmitGradeResponse()
-        finally:
-            db.close()
-
-    def SubmitGrades(self, request, context):
+    async def SubmitGrade(self, request, context):
+        async with SessionLocal() as db:
+            try:
+                rec = await upsert_grade(
+                    db,
+                    student_id=request.student_id,
+                    course_id=request.course_id or None,
+                    course_code=request.course_code or None,
+                    course_name=request.course_name or None,
+                    term=request.term,
+                    academic_year=request.academic_year,
+                    grade=request.grade,
+                )
+                return grade_pb2.SubmitGradeResponse(record=grade_row_to_proto(rec))
+            except HTTPException as exc:
+                await db.rollback()
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(exc.detail))
+                return grade_pb2.SubmitGradeResponse()
+            except IntegrityError:
+                await db.rollback()
+                context.set_code(grpc.StatusCode.ALREADY_EXISTS)
+                context.set_details("Grade already exists for student/course/term")
+                return grade_pb2.SubmitGradeResponse()
+
+    async def SubmitGrades(self, request, context):
         """Bulk upsert gRPC endpoint mirroring REST bulk submission."""
-        db = SessionLocal()
-        records = []
-        try:
-            for item in request.records:
-                rec = upsert_grade(
+        async with SessionLocal() as db:
+            try:
+                records = await upsert_grades(
                     db,
-                    student_id=item.student_id,
                     course_id=request.course_id or None,
                     course_code=request.course_code or None,
                     course_name=request.course_name or None,
                     term=request.term,
                     academic_year=request.academic_year,
-                    grade=item.grade,
+                    records=[(item.student_id, item.grade) for item in request.records],
                 )
-                records.append(rec)
-            return grade_pb2.SubmitGradesResponse(records=[grade_row_to_proto(rec) for rec in records])
-        except HTTPException as exc:
-            db.rollback()
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(exc.detail))
-            return grade_pb2.SubmitGradesResponse()
-        finally:
-            db.close()
+                return grade_pb2.SubmitGradesResponse(records=[grade_row_to_proto(rec) for rec in records])
+            except HTTPException as exc:
+                await db.rollback()
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(exc.detail))
+                return grade_pb2.SubmitGradesResponse()
 
-    def GetGradesByStudent(self, request, context):
-        db = SessionLocal()
-        try:
-            rows = (
-                db.execute(
-                    text(
-                        """
-                        SELECT id, student_id, course_id, course_code, course_name, term, academic_year, grade
-                        FROM grade.grades
-                        WHERE student_id = :student_id
-                        """
-                    ),
-                    {"student_id": request.student_id},
-                )
-                .mappings()
-            )
+    async def GetGradesByStudent(self, request, context):
+        async with SessionLocal() as db:
+            rows = (await db.execute(GRADES_BY_STUDENT, {"student_id": request.student_id})).mappings()
             return grade_pb2.GradesResponse(grades=[grade_row_to_proto(row) for row in rows])
-        finally:
-            db.close()
 
-    def ListGrades(self, request, context):
-        db = SessionLocal()
+    async def ListGrades(self, request, context):
+        """Stream a student's grades one record at a time off a server-side cursor."""
+        params = {"student_id": request.student_id}
         try:
-            rows = (
-                db.execute(
-                    text(
-                        """
-                        SELECT id, student_id, course_id, course_code, course_name, term, academic_year, grade
-                        FROM grade.grades
-                        WHERE student_id = :student_id
-                        """
-                    ),
-                    {"student_id": request.student_id},
+            sql = grade_page_sql("student_id = :student_id", params, request.limit, request.page_token)
+        except ValueError:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Invalid page_token")
+            return
+        # Hot read path: read plain row tuples off a streaming cursor instead of building RowMappings.
+        async with engine.connect() as conn:
+            result = await conn.stream(text(sql), params)
+            async for row in result:
+                yield grade_tuple_to_proto(row)
+
+    async def ListStudentTermGrades(self, request, context):
+        async with SessionLocal() as db:
+            groups = await get_student_term_grades(request.student_id, db)
+        return grade_pb2.ListStudentTermGradesResponse(
+            groups=[
+                grade_pb2.TermGradesGroup(
+                    academic_year=g["academic_year"],
+                    term=g["term"],
+                    courses=[
+                        grade_pb2.TermCourseGrade(
+                            course_id=c["course_id"] or "",
+                            course_code=c["course_code"],
+                            course_name=c["course_name"],
+                            grade=c["grade"] or "",
+                        )
+                        for c in g["courses"]
+                    ],
                 )
-                .mappings()
-            )
-            return grade_pb2.ListGradesResponse(grades=[grade_row_to_proto(row) for row in rows])
-        finally:
-            db.close()
+                for g in groups
+            ]
+        )
 
-    def ListStudentTermGrades(self, request, context):
-        db = SessionLocal()
-        try:
-            groups = get_student_term_grades(request.student_id, db)
-            return grade_pb2.ListStudentTermGradesResponse(
-                groups=[
-                    grade_pb2.TermGradesGroup(
-                        academic_year=g.academic_year,
-                        term=g.term,
-                        courses=[
-                            grade_pb2.TermCourseGrade(
-                                course_id=c.course_id or "",
-                                course_code=c.course_code,
-                                course_name=c.course_name,
-                                grade=c.grade or "",
-                            )
-                            for c in g.courses
-                        ],
-                    )
-                    for g in groups
-                ]
+    async def ListCourseGrades(self, request, context):
+        # Column names are fixed here; only the values come from the request.
+        params = {
+            column: value
+            for column, value in (
+                ("course_id", request.course_id),
+                ("course_code", request.course_code),
+                ("term", request.term),
+                ("academic_year", request.academic_year),
             )
-        finally:
-            db.close()
+            if value
+        }
+        if not params:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("At least one filter (course_id, course_code, term, academic_year) is required")
+            return
 
-    def ListCourseGrades(self, request, context):
-        db = SessionLocal()
+        where = " AND ".join(f"{column} = :{column}" for column in params)
         try:
-            filters = [
-                Grade.course_id == request.course_id if request.course_id else None,
-                Grade.course_code == request.course_code if request.course_code else None,
-                Grade.term == request.term if request.term else None,
-                Grade.academic_year == request.academic_year if request.academic_year else None,
-            ]
-            active_filters = [cond for cond in filters if cond is not None]
-            if not active_filters:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("At least one filter (course_id, course_code, term, academic_year) is required")
-                return grade_pb2.ListCourseGradesResponse()
-
-            rows = db.query(Grade).filter(*active_filters).all()
-            items = [
-                grade_pb2.GradeRecord(
-                    id=str(g.id),
-                    student_id=str(g.student_id),
-                    course_id=str(g.course_id) if g.course_id else "",
-                    course_code=g.course_code,
-                    course_name=g.course_name,
-                    term=g.term,
-                    academic_year=g.academic_year or "",
-                    grade=g.grade,
-                )
-                for g in rows
-            ]
-            return grade_pb2.ListCourseGradesResponse(grades=items)
-        finally:
-            db.close()
+            sql = grade_page_sql(where, params, request.limit, request.page_token)
+        except ValueError:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Invalid page_token")
+            return
+        # Large course rosters: stream row by row so neither the rows nor one big response sit in memory.
+        async with engine.connect() as conn:
+            result = await conn.stream(text(sql), params)
+            async for row in result:
+                yield grade_tuple_to_proto(row)
 
 
-def serve_grpc():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    grade_pb2_grpc.add_GradeServiceServicer_to_server(GradeService(), server)
-    server.add_insecure_port(f"[::]:{GRPC_PORT}")
-    server.start()
-    server.wait_for_termination()
+grpc_server: grpc.aio.Server | None = None
 
 
 @app.on_event("startup")
-def start_grpc_server():
+async def start_grpc_server():
+    """Serve gRPC from the app's own event loop so RPCs and REST share the asyncpg pool."""
+    global grpc_server
     # Ensure the DB schema has the self-contained course metadata columns before serving requests.
-    ensure_schema()
-    thread = threading.Thread(target=serve_grpc, daemon=True)
-    thread.start()
+    await ensure_schema()
+    grpc_server = grpc.aio.server(options=GRPC_SERVER_OPTIONS)
+    grade_pb2_grpc.add_GradeServiceServicer_to_server(GradeService(), grpc_server)
+    grpc_server.add_insecure_port(f"[::]:{GRPC_PORT}")
+    await grpc_server.start()
+
+
+@app.on_event("shutdown")
+async def stop_grpc_server():
+    if grpc_server is not None:
+        await grpc_server.stop(grace=5)
+    await engine.dispose()
@@ -88,8 +88,12 @@ CREATE TABLE IF NOT EXISTS grade.grades (
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     UNIQUE (student_id, course_code, term, academic_year)
 );
-CREATE INDEX IF NOT EXISTS idx_grades_student ON grade.grades (student_id);
-CREATE INDEX IF NOT EXISTS idx_grades_course ON grade.grades (course_id);
+-- Covering indexes for the student and course listings: equality filters, then id for keyset paging,
+-- with the remaining listed columns included so the planner can use index-only scans.
+CREATE INDEX IF NOT EXISTS idx_grades_student_id_covering ON grade.grades (student_id, id)
+    INCLUDE (course_id, course_code, course_name, term, academic_year, grade);
+CREATE INDEX IF NOT EXISTS idx_grades_course_term_year_covering ON grade.grades (course_id, term, academic_year, id)
+    INCLUDE (student_id, course_code, course_name, grade);
 CREATE INDEX IF NOT EXISTS idx_grades_course_code ON grade.grades (course_code);
 ALTER TABLE grade.grades ADD COLUMN IF NOT EXISTS course_code VARCHAR(64);
 ALTER TABLE grade.grades ADD COLUMN IF NOT EXISTS course_name TEXT;
@@ -104,6 +108,15 @@ ALTER TABLE grade.grades ALTER COLUMN academic_year SET NOT NULL;
 UPDATE grade.grades SET academic_year = '' WHERE academic_year IS NULL;
 ALTER TABLE grade.grades DROP CONSTRAINT IF EXISTS grades_student_id_course_id_term_key;
 CREATE UNIQUE INDEX IF NOT EXISTS uq_grades_student_course_term_year ON grade.grades (student_id, course_code, term, academic_year);
+CREATE INDEX IF NOT EXISTS idx_grades_student_term_order ON grade.grades (
+    student_id,
+    ((substring(academic_year from '[0-9]+'))::numeric) DESC NULLS LAST,
+    ((substring(term from '^[0-9]+(?:\.[0-9]+)?$'))::numeric) DESC NULLS LAST,
+    academic_year,
+    term,
+    course_code,
+    course_name
+);
 
 -- Seed demo users (plain text passwords allowed by auth-service fallback).
 INSERT INTO auth.users (id, user_number, name, email, role, password_hash)
@@ -158,3 +171,6 @@ VALUES (
   '10000000-0000-0000-0000-000000000001',
   'ENROLLED'
 );
+
+-- Populate statistics and the visibility map so index-only scans skip heap fetches from the start.
+VACUUM ANALYZE grade.grades;